@@ -255,7 +255,7 @@ export default function ComparePage() {
                   </div>
                   <div className="flex justify-between">
                     <span className="text-gray-400">Avg Latency</span>
-                    <span className="text-white font-medium">{modelA.avg_latency_ms.toFixed(0)}ms</span>
+                    <span className="text-white font-medium">{modelA.avg_latency_ms != null ? `${modelA.avg_latency_ms.toFixed(0)}ms` : "n/a"}</span>
                   </div>
                   <div className="flex justify-between">
                     <span className="text-gray-400">Total Cost</span>
@@ -301,7 +301,7 @@ export default function ComparePage() {
                   </div>
                   <div className="flex justify-between">
                     <span className="text-gray-400">Avg Latency</span>
-                    <span className="text-white font-medium">{modelB.avg_latency_ms.toFixed(0)}ms</span>
+                    <span className="text-white font-medium">{modelB.avg_latency_ms != null ? `${modelB.avg_latency_ms.toFixed(0)}ms` : "n/a"}</span>
                   </div>
                   <div className="flex justify-between">
                     <span className="text-gray-400">Total Cost</span>
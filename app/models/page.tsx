@@ -235,7 +235,7 @@ export default async function ModelsPage() {
           <div className="bg-[#141517] rounded-lg border border-white/[0.08] p-4">
             <div className="text-xs text-gray-500 mb-1">Fastest Avg</div>
             <div className="text-2xl font-semibold text-[#5E6AD2]">
-              {Math.min(...models.map((m) => m.avg_latency_ms)).toFixed(0)}ms
+              {Math.min(...models.filter((m) => m.avg_latency_ms != null).map((m) => m.avg_latency_ms)).toFixed(0)}ms
             </div>
           </div>
           <div className="bg-[#141517] rounded-lg border border-white/[0.08] p-4">
@@ -311,7 +311,7 @@ export default async function ModelsPage() {
                   </td>
                   <td className="px-6 py-4 text-right">
                     <span className="text-sm text-gray-300">
-                      {model.avg_latency_ms.toFixed(0)}ms
+                      {model.avg_latency_ms != null ? `${model.avg_latency_ms.toFixed(0)}ms` : "n/a"}
                     </span>
                   </td>
                   <td className="px-6 py-4 text-right">
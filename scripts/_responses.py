@@ -0,0 +1,27 @@
+"""
+Helpers for reading OpenAI Responses API objects.
+
+Shared by the model runners and the grader so the output walker lives in
+one place and neither side has to import the other.
+"""
+
+
+def first_output_text(response) -> str:
+    """Return the first output_text part of a Responses API response, or ""."""
+    # next() stops at the first output_text, skipping any later output items
+    return next(
+        (content.text
+         for item in response.output if item.type == "message"
+         for content in getattr(item, "content", ()) if content.type == "output_text"),
+        "",
+    )
+
+
+def output_text_from_body(body: dict) -> str:
+    """Return the first output_text of a Responses API body in dict form, or ""."""
+    return next(
+        (content.get("text", "")
+         for item in body.get("output", []) if item.get("type") == "message"
+         for content in item.get("content", []) if content.get("type") == "output_text"),
+        "",
+    )
@@ -0,0 +1,189 @@
+"""
+OpenAI Batch API runner for LLM Model Evaluation.
+
+Submits every (model, question) request of a sweep as Batch API jobs instead
+of live calls. Batched requests are billed at half price and draw on a
+separate, much larger rate limit, in exchange for finishing within 24h.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+
+from openai import AsyncOpenAI, OpenAI
+
+from config import ModelConfig
+from model_runner import AsyncModelRunner, ModelResponse
+
+# Batch job states after which the status no longer changes
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def build_batch_lines(
+    runners: Sequence[AsyncModelRunner],
+    questions: Sequence[tuple[str, str]],
+) -> dict[str, list[str]]:
+    """
+    Serialize every (runner, question) request as JSONL lines grouped by endpoint.
+    
+    A batch job targets a single endpoint, so Chat Completions and Responses
+    API models are submitted as separate jobs. Each custom_id is
+    "<runner index>:<question index>".
+    """
+    lines: dict[str, list[str]] = {}
+    for m, runner in enumerate(runners):
+        for i, (question, context) in enumerate(questions):
+            url, body = runner.batch_request(question, context)
+            lines.setdefault(url, []).append(json.dumps({
+                "custom_id": f"{m}:{i}",
+                "method": "POST",
+                "url": url,
+                "body": body,
+            }))
+    return lines
+
+
+async def submit_batch(
+    client: AsyncOpenAI,
+    endpoint: str,
+    lines: list[str],
+    filename: str = "evaluation_batch.jsonl",
+) -> str:
+    """Upload JSONL request lines and start a batch job, returning its id."""
+    batch_file = await client.files.create(file=(filename, "\n".join(lines).encode()), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=endpoint,
+        completion_window="24h",
+    )
+    print(f"   📦 Submitted {len(lines)} requests to {endpoint} as batch {batch.id}")
+    return batch.id
+
+
+async def wait_for_batch(client: AsyncOpenAI, batch_id: str, max_poll_interval: float = 60.0):
+    """Poll a batch job with exponential backoff until it reaches a terminal state."""
+    delay = 1.0
+    batch = await client.batches.retrieve(batch_id)
+    while batch.status not in _TERMINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, max_poll_interval)
+        batch = await client.batches.retrieve(batch_id)
+    return batch
+
+
+def parse_batch_output(output: str) -> dict[str, dict]:
+    """
+    Return the response body of every successful request in a batch output file, by custom_id.
+    
+    Failed requests and malformed or truncated lines are skipped, so their
+    custom_ids are simply missing and callers report them as failed instead
+    of one bad line discarding the whole batch.
+    """
+    bodies = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        response = row.get("response") or {}
+        if row.get("error") or response.get("status_code") != 200:
+            continue
+        bodies[row["custom_id"]] = response.get("body") or {}
+    return bodies
+
+
+async def run_batch_job(
+    client: AsyncOpenAI,
+    endpoint: str,
+    lines: list[str],
+    max_poll_interval: float = 60.0,
+    filename: str = "evaluation_batch.jsonl",
+) -> tuple[dict[str, dict], str | None]:
+    """Run one batch job, returning successful response bodies by custom_id and any job error."""
+    try:
+        batch_id = await submit_batch(client, endpoint, lines, filename)
+        batch = await wait_for_batch(client, batch_id, max_poll_interval)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            return {}, f"Batch {batch.id} ended with status {batch.status}"
+        
+        output = (await client.files.content(batch.output_file_id)).text
+    except Exception as e:
+        return {}, str(e)
+    
+    return parse_batch_output(output), None
+
+
+def run_batch_job_sync(
+    client: OpenAI,
+    endpoint: str,
+    lines: list[str],
+    max_poll_interval: float = 60.0,
+    filename: str = "evaluation_batch.jsonl",
+) -> tuple[dict[str, dict], str | None]:
+    """Blocking run_batch_job for a synchronous OpenAI client."""
+    try:
+        batch_file = client.files.create(file=(filename, "\n".join(lines).encode()), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=endpoint,
+            completion_window="24h",
+        )
+        print(f"   📦 Submitted {len(lines)} requests to {endpoint} as batch {batch.id}")
+        delay = 1.0
+        while batch.status not in _TERMINAL_STATUSES:
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            return {}, f"Batch {batch.id} ended with status {batch.status}"
+        
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        return {}, str(e)
+    
+    return parse_batch_output(output), None
+
+
+async def run_batch_evaluation(
+    client: AsyncOpenAI,
+    models: Sequence[ModelConfig],
+    questions: Sequence[tuple[str, str]],
+    max_poll_interval: float = 60.0,
+) -> dict[str, list[ModelResponse]]:
+    """
+    Run every question through every model as Batch API jobs.
+    
+    Jobs for different endpoints are submitted and polled concurrently.
+    Results are keyed by model name and keep the question order; requests
+    missing from the batch output become error responses.
+    """
+    runners = [AsyncModelRunner(model, client) for model in models]
+    jobs = build_batch_lines(runners, questions)
+    results = await asyncio.gather(*(
+        run_batch_job(client, endpoint, lines, max_poll_interval) for endpoint, lines in jobs.items()
+    ))
+    
+    bodies: dict[str, dict] = {}
+    job_errors = []
+    for job_bodies, job_error in results:
+        bodies.update(job_bodies)
+        if job_error:
+            job_errors.append(job_error)
+    missing_error = "; ".join(job_errors) or "Request failed in batch"
+    
+    responses = {}
+    for m, runner in enumerate(runners):
+        model_responses = []
+        for i, (question, context) in enumerate(questions):
+            body = bodies.get(f"{m}:{i}")
+            model_responses.append(
+                runner.batch_result(question, context, body) if body is not None
+                else runner._error_response(question, context, missing_error)
+            )
+        responses[runner.config.name] = model_responses
+    return responses
@@ -0,0 +1,346 @@
+"""
+On-disk caches for LLM Model Evaluation.
+
+Backed by SQLite so repeated sweeps over the same questions reuse responses
+that were already paid for in an earlier run instead of calling the API.
+Per-model run checkpoints are plain JSON shards so a crashed sweep can resume.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from config import (
+    GRADER_MODEL,
+    GRADER_REASONING_EFFORT,
+    GRADING_PROMPT,
+    SYSTEM_CITATION_PROMPT,
+    ModelConfig,
+)
+from grader import GradingResult
+from model_runner import ModelResponse
+
+# Changing the system prompt changes every answer, so it is part of each key
+_PROMPT_FINGERPRINT = hashlib.blake2b(SYSTEM_CITATION_PROMPT.encode(), digest_size=8).hexdigest()
+# Likewise the grader model, effort and rubric for every grade
+_GRADER_FINGERPRINT = hashlib.blake2b(
+    f"{GRADER_MODEL}\x00{GRADER_REASONING_EFFORT}\x00{GRADING_PROMPT}".encode(), digest_size=8
+).digest()
+# Cache hits whose last-used refresh is written in one transaction
+_TOUCH_BATCH_SIZE = 1000
+
+
+def _response_key(config: ModelConfig, question: str, context: str) -> bytes:
+    """Stable key for one (model configuration, question, context) request."""
+    parts = (
+        config.model_id,
+        config.api_type,
+        config.reasoning_effort or "",
+        config.verbosity or "",
+        _PROMPT_FINGERPRINT,
+        question,
+        context,
+    )
+    if config.stream:
+        # Streamed rows carry ttft_ms; non-streamed keys are unchanged so old entries still hit
+        parts += ("stream",)
+    return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).digest()
+
+
+class ResponseCache:
+    """
+    Persistent exact-match cache of successful model responses.
+    
+    Hits return the latency, token counts and cost measured on the original
+    call so reports built from cached runs match the run that produced them.
+    With ``replay`` set, runners treat misses as errors instead of calling
+    the API, so metric-only reruns cost nothing. Entries beyond
+    ``max_entries`` are evicted least-recently-used on close; hits refresh
+    their last-used time in batches rather than one write per hit.
+    """
+    
+    def __init__(self, path: str | Path, max_entries: int = 100_000, replay: bool = False):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL commits then skip the fsync; a crash of this process loses nothing
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key BLOB PRIMARY KEY,
+                response TEXT NOT NULL,
+                latency_ms REAL NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cost REAL NOT NULL,
+                last_used REAL NOT NULL,
+                ttft_ms REAL
+            )
+            """
+        )
+        # Databases created before streamed responses were cached lack ttft_ms
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "ttft_ms" not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN ttft_ms REAL")
+        self._conn.commit()
+        self._touched: set[bytes] = set()
+    
+    def get(self, config: ModelConfig, question: str, context: str) -> ModelResponse | None:
+        """Return the cached response for this request, or None."""
+        key = _response_key(config, question, context)
+        row = self._conn.execute(
+            "SELECT response, latency_ms, input_tokens, output_tokens, cost, ttft_ms FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._touched.add(key)
+        if len(self._touched) >= _TOUCH_BATCH_SIZE:
+            self._flush_touched()
+        response, latency_ms, input_tokens, output_tokens, cost, ttft_ms = row
+        return ModelResponse(
+            model_name=config.name,
+            question=question,
+            context=context,
+            response=response,
+            latency_ms=latency_ms,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost=cost,
+            ttft_ms=ttft_ms,
+        )
+    
+    def _flush_touched(self) -> None:
+        """Write queued last-used refreshes in one transaction."""
+        if self._touched:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE responses SET last_used = ? WHERE key = ?", ((now, key) for key in self._touched)
+            )
+            self._conn.commit()
+            self._touched.clear()
+    
+    def put(self, config: ModelConfig, result: ModelResponse) -> None:
+        """Store a successful response; failed calls are never cached."""
+        if result.error is not None:
+            return
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO responses
+                (key, response, latency_ms, input_tokens, output_tokens, cost, last_used, ttft_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                _response_key(config, result.question, result.context),
+                result.response,
+                result.latency_ms,
+                result.input_tokens,
+                result.output_tokens,
+                result.cost,
+                time.time(),
+                result.ttft_ms,
+            ),
+        )
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Evict least-recently-used entries over the limit and close the database."""
+        self._flush_touched()
+        self._conn.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+        self._conn.commit()
+        self._conn.close()
+
+
+class GradeCache:
+    """
+    Persistent exact-match cache of successful grades.
+    
+    Keyed by the grader's own (question, context, response) digest plus the
+    grader model, effort and rubric, so rerunning unchanged responses skips
+    the grader call. With ``replay`` set, graders turn misses into error
+    grades instead of calling the API. Entries beyond ``max_entries`` are
+    evicted least-recently-used on close.
+    """
+    
+    def __init__(self, path: str | Path, max_entries: int = 100_000, replay: bool = False):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS grades (
+                key BLOB PRIMARY KEY,
+                on_topic INTEGER NOT NULL,
+                grounded INTEGER NOT NULL,
+                no_contradiction INTEGER NOT NULL,
+                understandability INTEGER NOT NULL,
+                overall INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._touched: set[bytes] = set()
+    
+    def get(self, key: bytes) -> GradingResult | None:
+        """Return the cached grade for a grader cache key, or None."""
+        key = _GRADER_FINGERPRINT + key
+        row = self._conn.execute(
+            "SELECT on_topic, grounded, no_contradiction, understandability, overall FROM grades WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._touched.add(key)
+        if len(self._touched) >= _TOUCH_BATCH_SIZE:
+            self._flush_touched()
+        return GradingResult(*row)
+    
+    def _flush_touched(self) -> None:
+        """Write queued last-used refreshes in one transaction."""
+        if self._touched:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE grades SET last_used = ? WHERE key = ?", ((now, key) for key in self._touched)
+            )
+            self._conn.commit()
+            self._touched.clear()
+    
+    def put(self, key: bytes, result: GradingResult) -> None:
+        """Store a successful grade; grading errors are never cached."""
+        if result.error is not None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO grades VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                _GRADER_FINGERPRINT + key,
+                result.on_topic,
+                result.grounded,
+                result.no_contradiction,
+                result.understandability,
+                result.overall,
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Evict least-recently-used entries over the limit and close the database."""
+        self._flush_touched()
+        self._conn.execute(
+            """
+            DELETE FROM grades WHERE key IN (
+                SELECT key FROM grades ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+        self._conn.commit()
+        self._conn.close()
+
+
+def _checkpoint_settings(config: ModelConfig) -> dict:
+    """Everything besides the questions that a checkpoint shard's results depend on."""
+    return {
+        "model_id": config.model_id,
+        "api_type": config.api_type,
+        "reasoning_effort": config.reasoning_effort,
+        "verbosity": config.verbosity,
+        "stream": config.stream,
+        "prompt": _PROMPT_FINGERPRINT,
+        "grader": _GRADER_FINGERPRINT.hex(),
+    }
+
+
+class RunCheckpoint:
+    """
+    Per-model JSON shards of a sweep's responses and grades.
+    
+    Each model is saved as soon as it has been graded, so a crash loses at
+    most the models still in flight and a rerun can skip every finished
+    one. Shards record a digest of the question set and the model settings
+    that change its results, and are ignored when either changes or when
+    they no longer match the current result schema.
+    """
+    
+    def __init__(self, directory: str | Path, questions_digest: str):
+        self.directory = Path(directory)
+        self.questions_digest = questions_digest
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, model_key: str) -> Path:
+        return self.directory / f"{model_key}.json"
+    
+    def load(self, config: ModelConfig) -> tuple[list[ModelResponse], list[GradingResult]] | None:
+        """Return the saved responses and grades for a model, or None if there is no valid shard."""
+        try:
+            with open(self._path(config.key), "r", encoding="utf-8") as f:
+                shard = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if shard.get("questions") != self.questions_digest or shard.get("settings") != _checkpoint_settings(config):
+            return None
+        
+        try:
+            responses = [ModelResponse(**r) for r in shard["responses"]]
+            grades = [GradingResult(**g) for g in shard["grades"]]
+        except (KeyError, TypeError):
+            # Written by an older version with different result fields
+            return None
+        if len(responses) != len(grades):
+            return None
+        return responses, grades
+    
+    def save(self, config: ModelConfig, responses: list[ModelResponse], grades: list[GradingResult]) -> None:
+        """Write a model's shard, replacing any earlier one atomically."""
+        shard = {
+            "questions": self.questions_digest,
+            "model_key": config.key,
+            "settings": _checkpoint_settings(config),
+            "responses": [asdict(r) for r in responses],
+            "grades": [
+                {
+                    "on_topic": g.on_topic,
+                    "grounded": g.grounded,
+                    "no_contradiction": g.no_contradiction,
+                    "understandability": g.understandability,
+                    "overall": g.overall,
+                    "error": g.error,
+                }
+                for g in grades
+            ],
+        }
+        path = self._path(config.key)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(shard, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -0,0 +1,67 @@
+"""
+Paraphrase deduplication for LLM Model Evaluation.
+
+Langfuse exports often hold the same question worded several ways. Each
+distinct question is embedded once, and questions whose embeddings are
+close enough are answered by a single canonical question, so every model
+is called once per cluster instead of once per wording.
+"""
+
+import math
+from collections.abc import Sequence
+from operator import mul
+
+from openai import AsyncOpenAI
+
+from config import EMBEDDING_MODEL
+
+# Inputs per embeddings request
+_EMBED_BATCH_SIZE = 100
+
+
+async def embed_texts(
+    client: AsyncOpenAI,
+    texts: Sequence[str],
+    model: str = EMBEDDING_MODEL,
+    batch_size: int = _EMBED_BATCH_SIZE,
+) -> list[list[float]]:
+    """Embed texts in batches, returning one unit-length vector per text."""
+    vectors = []
+    for start in range(0, len(texts), batch_size):
+        response = await client.embeddings.create(model=model, input=list(texts[start:start + batch_size]))
+        for item in sorted(response.data, key=lambda d: d.index):
+            norm = math.sqrt(sum(x * x for x in item.embedding)) or 1.0
+            vectors.append([x / norm for x in item.embedding])
+    return vectors
+
+
+async def paraphrase_canonicals(
+    client: AsyncOpenAI,
+    pairs: Sequence[tuple[str, str]],
+    threshold: float,
+) -> list[int]:
+    """
+    Map each (question, context) pair to the index of the pair that answers it.
+    
+    Pairs are merged greedily in order: a pair joins the first earlier
+    canonical pair with the same context whose question embedding has cosine
+    similarity of at least ``threshold``, otherwise it becomes canonical
+    itself. Context must match exactly, since the same question over
+    different retrieved context calls for a different answer.
+    """
+    texts = list(dict.fromkeys(question for question, _ in pairs))
+    vectors = dict(zip(texts, await embed_texts(client, texts)))
+    
+    canonical = []
+    by_context: dict[str, list[tuple[list[float], int]]] = {}
+    for j, (question, context) in enumerate(pairs):
+        vector = vectors[question]
+        candidates = by_context.setdefault(context, [])
+        for other, k in candidates:
+            if sum(map(mul, vector, other)) >= threshold:
+                canonical.append(k)
+                break
+        else:
+            candidates.append((vector, j))
+            canonical.append(j)
+    return canonical
@@ -3,18 +3,52 @@ Grader for LLM Response Evaluation.
 
 Uses GPT-5.1 with high reasoning effort to grade responses
 on 5 dimensions: on_topic, grounded, no_contradiction, understandability, overall.
+
+Supports both synchronous grading and asynchronous grading with bounded concurrency.
 """
 
+import asyncio
+import hashlib
 import json
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
-from openai import OpenAI
+from _responses import first_output_text, output_text_from_body
+from config import (
+    GRADER_MODEL,
+    GRADER_REASONING_EFFORT,
+    format_combined_grading_prompt,
+    format_grading_prompt,
+)
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+    
+    from cache import GradeCache
 
-from config import GRADER_MODEL, GRADER_REASONING_EFFORT, GRADING_PROMPT
+_JSON_DECODER = json.JSONDecoder()
+_FENCE_HEAD_RE = re.compile(r'^```(?:json)?\s*')
+_FENCE_TAIL_RE = re.compile(r'\s*```$')
+_SCORE_KEYS = ("on_topic", "grounded", "no_contradiction", "understandability", "overall")
+# A score key followed by its value, flat (`"overall": 4`) or nested (`"overall": {"score": 4`)
+_SCORE_RE = re.compile(
+    r'"(' + "|".join(_SCORE_KEYS) + r')"\s*:\s*(?:\{[^{}]*?"score"\s*:\s*)?"?(-?\d+)'
+)
+# Grades are a few hundred bytes; beyond this, scan for the scores instead of building the tree
+_MAX_FULL_PARSE_CHARS = 16_384
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GradingResult:
     """Result from grading a response."""
     on_topic: int  # 1-5
@@ -23,127 +57,539 @@ class GradingResult:
     understandability: int  # 1-5
     overall: int  # 1-5
     error: str | None = None
+    _sum: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Summed once here since averages are read repeatedly during aggregation
+        object.__setattr__(self, "_sum", self.on_topic + self.grounded + self.no_contradiction +
+                           self.understandability + self.overall)
     
     @property
     def average(self) -> float:
         """Calculate average score across all dimensions."""
-        return (self.on_topic + self.grounded + self.no_contradiction + 
-                self.understandability + self.overall) / 5
+        return self._sum / 5
 
 
-class Grader:
-    """Grades LLM responses using GPT-5.1."""
+# All-ones grade that error results are copied from
+_ERROR_TEMPLATE = GradingResult(
+    on_topic=1, grounded=1, no_contradiction=1,
+    understandability=1, overall=1, error=""
+)
+
+
+def error_result(error: str) -> GradingResult:
+    """Lowest-score GradingResult carrying the given error message."""
+    return replace(_ERROR_TEMPLATE, error=error)
+
+
+_REPLAY_MISS = error_result("Not in grade cache (replay mode)")
+
+
+def _cache_key(question: str, context: str, response: str) -> bytes:
+    """Digest identifying a (question, context, response) grading input."""
+    payload = f"{question}\x00{context}\x00{response}".encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class _BaseGrader:
+    """Shared caching and response parsing for the sync and async graders."""
     
-    def __init__(self, client: OpenAI | None = None):
-        self.client = client or OpenAI()
+    def __init__(self, cache_size: int = 10_000, disk_cache: "GradeCache | None" = None):
         self.model = GRADER_MODEL
         self.reasoning_effort = GRADER_REASONING_EFFORT
+        # Successful grades keyed by a digest of (question, context, response),
+        # least recently used first
+        self._cache: OrderedDict[bytes, GradingResult] = OrderedDict()
+        self.cache_size = cache_size
+        # Optional persistent cache behind the in-memory one, shared across runs
+        self.disk_cache = disk_cache
+        # Request fields that are identical for every grade call
+        self._base_request = {
+            "model": self.model,
+            "instructions": "You are an expert evaluator. Respond with only a JSON object.",
+            "reasoning": {"effort": self.reasoning_effort},
+            "text": {"format": {"type": "text"}},
+        }
+        self._combined_request = {
+            **self._base_request,
+            "instructions": "You are an expert evaluator. Respond with only a JSON array.",
+        }
+    
+    def _cache_get(self, key: bytes) -> GradingResult | None:
+        """
+        Return a cached grade, marking it most recently used.
+        
+        When the disk cache is in replay mode a miss returns an error grade
+        instead of None, so callers never fall through to the grader API.
+        """
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        elif self.disk_cache is not None:
+            result = self.disk_cache.get(key)
+            if result is not None:
+                self._cache_put(key, result, persist=False)
+            elif self.disk_cache.replay:
+                result = _REPLAY_MISS
+        return result
+    
+    def _cache_put(self, key: bytes, result: GradingResult, persist: bool = True):
+        """Cache a successful grade, evicting the least recently used beyond cache_size."""
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        if persist and self.disk_cache is not None:
+            self.disk_cache.put(key, result)
+    
+    def _process_grader_response(self, grader_response, key: bytes) -> GradingResult:
+        """Turn a grader API response into a GradingResult, caching successes."""
+        response_text = self._extract_response_text(grader_response)
+        
+        if not response_text:
+            return error_result("No output_text found in grader response")
+        
+        result = self._parse_grading_response(response_text)
+        if result.error is None:
+            self._cache_put(key, result)
+        return result
+    
+    def _extract_response_text(self, grader_response) -> str:
+        """Extract text content from the API response."""
+        return first_output_text(grader_response)
+    
+    def _parse_grading_response(self, response_text: str) -> GradingResult:
+        """Parse the JSON grading response with robust handling."""
+        if len(response_text) > _MAX_FULL_PARSE_CHARS:
+            scores = _scan_scores(response_text)
+            if scores is not None:
+                return _result_from_data(scores)
+        
+        try:
+            return _result_from_data(_load_json(response_text, "{"))
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+            return error_result(f"Failed to parse grading response: {e}")
+    
+    def _batch_line(self, custom_id: str, question: str, context: str, response: str) -> str:
+        """Serialize one grading request as a Batch API JSONL line."""
+        return json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {**self._base_request, "input": format_grading_prompt(question, context, response)},
+        })
+    
+    def _grades_from_bodies(self, bodies: dict[str, dict]) -> dict[str, GradingResult]:
+        """Parse a grading batch's successful response bodies into grades by custom_id."""
+        batch_results = {}
+        for custom_id, body in bodies.items():
+            response_text = output_text_from_body(body)
+            batch_results[custom_id] = (
+                self._parse_grading_response(response_text) if response_text
+                else error_result("No output_text found in grader response")
+            )
+        return batch_results
+    
+    def _parse_combined_response(self, response_text: str, count: int) -> list[GradingResult] | None:
+        """Parse a combined grading response; None unless it holds exactly `count` grades."""
+        try:
+            data = _load_json(response_text, "[")
+        except (json.JSONDecodeError, ValueError):
+            return None
+        if not isinstance(data, list) or len(data) != count:
+            return None
+        if not all(isinstance(item, dict) for item in data):
+            return None
+        return [_result_from_data(item) for item in data]
+
+
+def _load_json(response_text: str, opener: str):
+    """Load JSON from grader output, tolerating code fences and surrounding prose."""
+    # Fast path for the common case of bare JSON: no strip copy, no fence checks
+    if response_text[:1] == opener:
+        try:
+            return _json_loads(response_text)
+        except json.JSONDecodeError:
+            pass
+    
+    # Strip markdown code fences if present
+    cleaned = response_text.strip()
+    if cleaned.startswith("```"):
+        cleaned = _FENCE_HEAD_RE.sub('', cleaned)
+        if cleaned.endswith("```"):
+            cleaned = _FENCE_TAIL_RE.sub('', cleaned)
+    
+    # Try direct parse first
+    try:
+        return _json_loads(cleaned)
+    except json.JSONDecodeError:
+        start = cleaned.find(opener)
+        if start == -1:
+            raise ValueError("No JSON object found in response")
+    
+    # Usually the JSON is just wrapped in prose, so try the outermost span first
+    end = cleaned.rfind("}" if opener == "{" else "]")
+    try:
+        return _json_loads(cleaned[start:end + 1])
+    except json.JSONDecodeError:
+        # Decode the first complete value, ignoring any trailing prose
+        data, _ = _JSON_DECODER.raw_decode(cleaned, start)
+        return data
+
+
+def _scan_scores(response_text: str) -> dict | None:
+    """Pull the five scores out of oversized grader output without a full JSON parse."""
+    scores: dict[str, str] = {}
+    for match in _SCORE_RE.finditer(response_text):
+        scores.setdefault(match.group(1), match.group(2))
+        if len(scores) == len(_SCORE_KEYS):
+            return scores
+    # Some score didn't match the simple shapes; let the full parser decide
+    return None
+
+
+def _score(raw_val) -> int:
+    """Validate one score, handling both nested and flat formats."""
+    # Plain ints are by far the most common value
+    if type(raw_val) is int:
+        return 1 if raw_val < 1 else min(raw_val, 5)
+    if raw_val is None:
+        return 1
+    
+    # Handle nested format: {"score": 5, "explanation": "..."}
+    if isinstance(raw_val, dict):
+        raw_val = raw_val.get("score", 1)
+    
+    try:
+        val = int(raw_val)
+        return max(1, min(5, val))
+    except (ValueError, TypeError):
+        return 1
+
+
+def _result_from_data(data: dict) -> GradingResult:
+    """Build a GradingResult from parsed grader JSON."""
+    get = data.get
+    return GradingResult(
+        on_topic=_score(get("on_topic")),
+        grounded=_score(get("grounded")),
+        no_contradiction=_score(get("no_contradiction")),
+        understandability=_score(get("understandability")),
+        overall=_score(get("overall")),
+    )
+
+
+class Grader(_BaseGrader):
+    """Grades LLM responses using GPT-5.1."""
+    
+    def __init__(
+        self,
+        client: "OpenAI | None" = None,
+        cache_size: int = 10_000,
+        disk_cache: "GradeCache | None" = None,
+    ):
+        super().__init__(cache_size, disk_cache)
+        if client is None:
+            # Deferred so importing GradingResult doesn't load the OpenAI SDK
+            from openai import OpenAI
+            client = OpenAI()
+        self.client = client
+        self._create = client.responses.create
     
     def grade(self, question: str, context: str, response: str) -> GradingResult:
         """Grade a single response."""
-        if not response or response.strip() == "":
-            return GradingResult(
-                on_topic=1, grounded=1, no_contradiction=1,
-                understandability=1, overall=1,
-                error="Empty response"
-            )
+        if not response or response.isspace():
+            return error_result("Empty response")
+        
+        key = _cache_key(question, context, response)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
         try:
-            prompt = GRADING_PROMPT.format(
-                question=question,
-                context=context,
-                response=response
-            )
+            prompt = format_grading_prompt(question, context, response)
             
-            grader_response = self.client.responses.create(
-                model=self.model,
-                instructions="You are an expert evaluator. Respond with only a JSON object.",
-                input=prompt,
-                reasoning={"effort": self.reasoning_effort},
-                text={"format": {"type": "text"}},
-            )
+            grader_response = self._create(input=prompt, **self._base_request)
             
-            # Extract text from response
-            response_text = self._extract_response_text(grader_response)
+            return self._process_grader_response(grader_response, key)
             
-            if not response_text:
-                return GradingResult(
-                    on_topic=1, grounded=1, no_contradiction=1,
-                    understandability=1, overall=1,
-                    error="No output_text found in grader response"
+        except Exception as e:
+            return error_result(str(e))
+    
+    def grade_combined(
+        self, items: Iterable[tuple[str, str, str]], batch_size: int = 10
+    ) -> list[GradingResult]:
+        """Grade (question, context, response) triples with one grader call per batch.
+        
+        Empty responses and cache hits are resolved without a call, and identical
+        triples are graded once. A batch whose combined response cannot be parsed
+        into one grade per item is regraded one item at a time through grade().
+        """
+        items = list(items)
+        results: list[GradingResult | None] = [None] * len(items)
+        # Identical triples share one slot in a combined prompt
+        pending: dict[bytes, list[int]] = {}
+        
+        for i, (question, context, response) in enumerate(items):
+            if not response or response.isspace():
+                results[i] = error_result("Empty response")
+                continue
+            key = _cache_key(question, context, response)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+        groups = list(pending.items())
+        
+        for start in range(0, len(groups), batch_size):
+            batch = groups[start:start + batch_size]
+            grades = None
+            try:
+                prompt = format_combined_grading_prompt([items[indices[0]] for _, indices in batch])
+                grader_response = self._create(input=prompt, **self._combined_request)
+                grades = self._parse_combined_response(
+                    self._extract_response_text(grader_response), len(batch)
                 )
+            except Exception:
+                grades = None
             
-            return self._parse_grading_response(response_text)
+            if grades is None:
+                grades = [self.grade(*items[indices[0]]) for _, indices in batch]
             
-        except Exception as e:
-            return GradingResult(
-                on_topic=1, grounded=1, no_contradiction=1,
-                understandability=1, overall=1,
-                error=str(e)
-            )
+            for (key, indices), grade in zip(batch, grades):
+                if grade.error is None:
+                    self._cache_put(key, grade)
+                for i in indices:
+                    results[i] = grade
+        
+        return results
     
-    def _extract_response_text(self, grader_response) -> str:
-        """Extract text content from the API response."""
-        for item in grader_response.output:
-            if item.type == "message":
-                for content in item.content:
-                    if content.type == "output_text":
-                        return content.text
-        return ""
+    def grade_batch_offline(
+        self, items: Iterable[tuple[str, str, str]], max_poll_interval: float = 60.0
+    ) -> list[GradingResult]:
+        """Grade (question, context, response) triples through the OpenAI Batch API.
+        
+        Batch requests are billed at half price but may take up to 24h; this call
+        blocks until the job finishes, polling with exponential backoff up to
+        max_poll_interval seconds.
+        Empty responses and cache hits are resolved without submitting them,
+        and identical triples are submitted once.
+        """
+        items = list(items)
+        results: list[GradingResult | None] = [None] * len(items)
+        pending: dict[bytes, list[int]] = {}
+        
+        for i, (question, context, response) in enumerate(items):
+            if not response or response.isspace():
+                results[i] = error_result("Empty response")
+                continue
+            key = _cache_key(question, context, response)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if pending:
+            lines = [
+                self._batch_line(str(n), *items[indices[0]])
+                for n, indices in enumerate(pending.values())
+            ]
+            batch_results, batch_error = self._run_batch_job(lines, max_poll_interval)
+            for n, (key, indices) in enumerate(pending.items()):
+                grade = batch_results.get(str(n)) or error_result(
+                    batch_error or "Request failed in grading batch"
+                )
+                if grade.error is None:
+                    self._cache_put(key, grade)
+                for i in indices:
+                    results[i] = grade
+        
+        return results
     
-    def _parse_grading_response(self, response_text: str) -> GradingResult:
-        """Parse the JSON grading response with robust handling."""
-        try:
-            # Strip markdown code fences if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```"):
-                cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
-                cleaned = re.sub(r'\s*```$', '', cleaned)
-            
-            # Try direct parse first
-            data = None
-            try:
-                data = json.loads(cleaned)
-            except json.JSONDecodeError:
-                # Find the outermost braces (handles nested objects)
-                start = cleaned.find('{')
-                end = cleaned.rfind('}')
-                if start != -1 and end != -1 and end > start:
-                    data = json.loads(cleaned[start:end + 1])
-                else:
-                    raise ValueError("No JSON object found in response")
-            
-            if data is None:
-                raise ValueError("Failed to parse JSON from response")
+    def _run_batch_job(
+        self, lines: list[str], max_poll_interval: float
+    ) -> tuple[dict[str, GradingResult], str | None]:
+        """Submit a JSONL batch of grading requests and parse its output by custom_id."""
+        # Deferred like the client import; batch_runner loads the OpenAI SDK
+        from batch_runner import run_batch_job_sync
+        
+        bodies, batch_error = run_batch_job_sync(
+            self.client, "/v1/responses", lines, max_poll_interval, "grading_batch.jsonl"
+        )
+        return self._grades_from_bodies(bodies), batch_error
+
+
+class AsyncGrader(_BaseGrader):
+    """Asynchronous grader with bounded concurrency."""
+    
+    def __init__(
+        self,
+        client: "AsyncOpenAI | None" = None,
+        max_concurrent: int = 10,
+        cache_size: int = 10_000,
+        disk_cache: "GradeCache | None" = None,
+    ):
+        super().__init__(cache_size, disk_cache)
+        if client is None:
+            # Deferred so importing GradingResult doesn't load the OpenAI SDK
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI()
+        self.client = client
+        self._create = client.responses.create
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_retries = 3
+        self.retry_delay = 5
+        self._in_flight: dict[bytes, asyncio.Future[GradingResult]] = {}
+    
+    async def grade(self, question: str, context: str, response: str) -> GradingResult:
+        """Grade a single response with bounded concurrency."""
+        if not response or response.isspace():
+            return error_result("Empty response")
+        
+        # Checked before the semaphore so cache hits never wait for a slot
+        key = _cache_key(question, context, response)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        # Identical triples graded concurrently share one API call
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            prompt = format_grading_prompt(question, context, response)
+            in_flight = asyncio.ensure_future(self._grade_uncached(prompt, key))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so a cancelled waiter doesn't cancel the call for the others sharing it
+        return await asyncio.shield(in_flight)
+    
+    async def _grade_uncached(self, prompt: str, key: bytes) -> GradingResult:
+        """Call the grader API for a prompt, retrying failed requests."""
+        async with self.semaphore:
+            last_error = None
             
-            # Validate and extract scores (handles both nested and flat formats)
-            def get_score(key: str) -> int:
-                """Extract and validate a score, handling both nested and flat formats."""
-                raw_val = data.get(key)
-                if raw_val is None:
-                    return 1
+            for attempt in range(self.max_retries):
+                try:
+                    grader_response = await self._create(input=prompt, **self._base_request)
+                    
+                    return self._process_grader_response(grader_response, key)
                     
-                # Handle nested format: {"score": 5, "explanation": "..."}
-                if isinstance(raw_val, dict):
-                    raw_val = raw_val.get("score", 1)
-                
+                except Exception as e:
+                    last_error = str(e)
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self.retry_delay)
+            
+            return error_result(last_error or "Max retries exceeded")
+    
+    async def grade_batch(self, items: Iterable[tuple[str, str, str]]) -> list[GradingResult]:
+        """Grade a batch of (question, context, response) triples concurrently."""
+        tasks = [self.grade(q, c, r) for q, c, r in items]
+        return await asyncio.gather(*tasks)
+    
+    async def grade_combined(
+        self, items: Iterable[tuple[str, str, str]], batch_size: int = 10
+    ) -> list[GradingResult]:
+        """Grade triples with one grader call per batch of batch_size, batches running concurrently.
+        
+        Empty responses and cache hits are resolved without a call, and identical
+        triples are graded once. A batch whose combined response cannot be parsed
+        into one grade per item is regraded one item at a time through grade().
+        """
+        items = list(items)
+        results: list[GradingResult | None] = [None] * len(items)
+        # Identical triples share one slot in a combined prompt
+        pending: dict[bytes, list[int]] = {}
+        
+        for i, (question, context, response) in enumerate(items):
+            if not response or response.isspace():
+                results[i] = error_result("Empty response")
+                continue
+            key = _cache_key(question, context, response)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+        groups = list(pending.items())
+        
+        async def grade_group(batch: list[tuple[bytes, list[int]]]) -> None:
+            grades = None
+            async with self.semaphore:
                 try:
-                    val = int(raw_val)
-                    return max(1, min(5, val))
-                except (ValueError, TypeError):
-                    return 1
+                    prompt = format_combined_grading_prompt([items[indices[0]] for _, indices in batch])
+                    grader_response = await self._create(input=prompt, **self._combined_request)
+                    grades = self._parse_combined_response(
+                        self._extract_response_text(grader_response), len(batch)
+                    )
+                except Exception:
+                    grades = None
             
-            return GradingResult(
-                on_topic=get_score("on_topic"),
-                grounded=get_score("grounded"),
-                no_contradiction=get_score("no_contradiction"),
-                understandability=get_score("understandability"),
-                overall=get_score("overall"),
-            )
+            if grades is None:
+                grades = await asyncio.gather(*(self.grade(*items[indices[0]]) for _, indices in batch))
             
-        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-            return GradingResult(
-                on_topic=1, grounded=1, no_contradiction=1,
-                understandability=1, overall=1,
-                error=f"Failed to parse grading response: {e}"
-            )
\ No newline at end of file
+            for (key, indices), grade in zip(batch, grades):
+                if grade.error is None:
+                    self._cache_put(key, grade)
+                for i in indices:
+                    results[i] = grade
+        
+        await asyncio.gather(*(
+            grade_group(groups[start:start + batch_size])
+            for start in range(0, len(groups), batch_size)
+        ))
+        return results
+    
+    async def grade_batch_offline(
+        self, items: Iterable[tuple[str, str, str]], max_poll_interval: float = 60.0
+    ) -> list[GradingResult]:
+        """Grade (question, context, response) triples through the OpenAI Batch API.
+        
+        Batch requests are billed at half price but may take up to 24h; the job
+        is polled with exponential backoff up to max_poll_interval seconds.
+        Empty responses and cache hits are resolved without submitting them,
+        and identical triples are submitted once.
+        """
+        items = list(items)
+        results: list[GradingResult | None] = [None] * len(items)
+        pending: dict[bytes, list[int]] = {}
+        
+        for i, (question, context, response) in enumerate(items):
+            if not response or response.isspace():
+                results[i] = error_result("Empty response")
+                continue
+            key = _cache_key(question, context, response)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        if pending:
+            lines = [
+                self._batch_line(str(n), *items[indices[0]])
+                for n, indices in enumerate(pending.values())
+            ]
+            batch_results, batch_error = await self._run_batch_job(lines, max_poll_interval)
+            for n, (key, indices) in enumerate(pending.items()):
+                grade = batch_results.get(str(n)) or error_result(
+                    batch_error or "Request failed in grading batch"
+                )
+                if grade.error is None:
+                    self._cache_put(key, grade)
+                for i in indices:
+                    results[i] = grade
+        
+        return results
+    
+    async def _run_batch_job(
+        self, lines: list[str], max_poll_interval: float
+    ) -> tuple[dict[str, GradingResult], str | None]:
+        """Submit a JSONL batch of grading requests and parse its output by custom_id."""
+        # Deferred like the client import; batch_runner loads the OpenAI SDK
+        from batch_runner import run_batch_job
+        
+        bodies, batch_error = await run_batch_job(
+            self.client, "/v1/responses", lines, max_poll_interval, "grading_batch.jsonl"
+        )
+        return self._grades_from_bodies(bodies), batch_error
@@ -7,73 +7,210 @@ Supports both synchronous and asynchronous execution with:
 """
 
 import asyncio
+import importlib.util
+import random
 import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from openai import AsyncOpenAI, OpenAI
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    OpenAI,
+    RateLimitError,
+    Timeout,
+)
 
-from config import ModelConfig, SYSTEM_CITATION_PROMPT
+try:
+    from openai import DefaultAioHttpClient
+except ImportError:  # Older SDKs ship only the httpx transport
+    DefaultAioHttpClient = None
 
+from _responses import first_output_text, output_text_from_body
+from config import (
+    BATCH_PRICE_MULTIPLIER,
+    CHAT_COMPLETIONS_API,
+    SYSTEM_CITATION_PROMPT,
+    ModelConfig,
+)
 
-@dataclass
+if TYPE_CHECKING:
+    from cache import ResponseCache
+
+MAX_RETRY_DELAY = 60.0
+RETRY_JITTER = 1.0
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install "httpx[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_DEFAULT_ASYNC_CLIENT: AsyncOpenAI | None = None
+# Long read timeout: high-effort reasoning calls can run for minutes
+_CLIENT_TIMEOUT = Timeout(600.0, connect=5.0)
+# The SDK's own Limits class; httpx in openai 1.x/2.x, httpx2 from 3.x on
+_Limits = type(DEFAULT_CONNECTION_LIMITS)
+
+
+def get_async_client(use_aiohttp: bool = False, max_connections: int = 64) -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client, creating it on first use.
+    
+    Every runner (and the grader) shares this client so all calls reuse one
+    keep-alive connection pool instead of opening a pool per model. With
+    ``use_aiohttp`` the first call builds it on the SDK's aiohttp transport
+    (``pip install "openai[aiohttp]"``), which holds up better than httpx
+    at high concurrency. ``max_connections`` sizes the pool of either
+    transport; size it to the peak number of in-flight calls so requests
+    never queue for a connection. Later calls return the existing client.
+    """
+    global _DEFAULT_ASYNC_CLIENT
+    if _DEFAULT_ASYNC_CLIENT is None:
+        limits = _Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 2)
+        http_client = None
+        if use_aiohttp:
+            try:
+                if DefaultAioHttpClient is None:
+                    raise RuntimeError("openai SDK too old for the aiohttp transport")
+                http_client = DefaultAioHttpClient(limits=limits, timeout=_CLIENT_TIMEOUT)
+            except RuntimeError as e:
+                print(f"Warning: aiohttp transport unavailable ({e}); using httpx")
+        if http_client is None:
+            http_client = DefaultAsyncHttpxClient(
+                limits=limits,
+                http2=_HTTP2_AVAILABLE,
+                timeout=_CLIENT_TIMEOUT,
+            )
+        _DEFAULT_ASYNC_CLIENT = AsyncOpenAI(http_client=http_client)
+    return _DEFAULT_ASYNC_CLIENT
+
+
+async def close_async_client() -> None:
+    """Close the shared client, releasing its connections before the event loop exits."""
+    global _DEFAULT_ASYNC_CLIENT
+    if _DEFAULT_ASYNC_CLIENT is not None:
+        await _DEFAULT_ASYNC_CLIENT.close()
+        _DEFAULT_ASYNC_CLIENT = None
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read the server-requested delay from a 429 response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return None
+
+
+def retry_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """
+    Seconds to wait before retrying after ``error``.
+    
+    Rate-limit errors honour the provider's Retry-After header; any other
+    failure uses capped exponential backoff with random jitter so parallel
+    workers don't retry in lockstep.
+    """
+    if isinstance(error, RateLimitError):
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(MAX_RETRY_DELAY, retry_after)
+    return min(MAX_RETRY_DELAY, base_delay * 2 ** attempt) + random.uniform(0, RETRY_JITTER)
+
+
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_CITATION_PROMPT}
+_USER_TEMPLATE = "Context:\n{}\n\nQuestion: {}"
+
+
+def _responses_input(question: str, context: str) -> str:
+    """Build the user message sent with every request."""
+    return _USER_TEMPLATE.format(context, question)
+
+
+def _chat_messages(question: str, context: str) -> list[dict]:
+    """Build the Chat Completions message list around the shared system message."""
+    return [_SYSTEM_MESSAGE, {"role": "user", "content": _responses_input(question, context)}]
+
+
+@dataclass(slots=True, frozen=True)
 class ModelResponse:
-    """Response from a model run."""
+    """Response from a model run.
+    
+    Token counts and cost are always set, and are zero for failed calls, so
+    aggregations can sum them without checking for missing fields. Latency
+    is None when it was not measured (Batch API results).
+    """
     model_name: str
     question: str
     context: str
     response: str
-    latency_ms: float
+    latency_ms: float | None
     input_tokens: int
     output_tokens: int
     cost: float  # Calculated cost in USD
     error: str | None = None
+    ttft_ms: float | None = None  # Time to first output token, streamed calls only
 
 
-class ModelRunner:
-    """Synchronous model runner."""
+class _ResponseStream:
+    """Collects the events of a streamed Responses API call."""
     
-    def __init__(self, config: ModelConfig, client: OpenAI | None = None):
-        self.config = config
-        self.client = client or OpenAI()
-        self.max_retries = 3
-        self.retry_delay = 5
+    __slots__ = ("parts", "response", "start_time", "ttft_ms")
     
-    def run(self, question: str, context: str) -> ModelResponse:
-        """Run a single question through the model."""
-        last_error = None
-        
-        for attempt in range(self.max_retries):
-            try:
-                # Reset start time for each attempt so latency reflects only the successful call
-                start_time = time.time()
-                
-                if self.config.api_type == "chat_completions":
-                    return self._run_chat_completions(question, context, start_time)
-                else:
-                    return self._run_responses(question, context, start_time)
-                    
-            except Exception as e:
-                last_error = str(e)
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-        
-        return self._error_response(question, context, last_error or "Max retries exceeded")
+    def __init__(self, start_time: float):
+        self.start_time = start_time
+        self.parts: list[str] = []
+        self.ttft_ms: float | None = None
+        self.response = None
     
-    def _run_chat_completions(self, question: str, context: str, start_time: float) -> ModelResponse:
-        """Run using Chat Completions API (GPT-4o-mini)."""
-        messages = [
-            {"role": "system", "content": SYSTEM_CITATION_PROMPT},
-            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"}
-        ]
-        
-        response = self.client.chat.completions.create(
-            model=self.config.model_id,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1024,
-        )
-        
-        latency_ms = (time.time() - start_time) * 1000
+    def feed(self, event) -> None:
+        """Record one stream event."""
+        if event.type == "response.output_text.delta":
+            if self.ttft_ms is None:
+                self.ttft_ms = (time.perf_counter() - self.start_time) * 1000
+            self.parts.append(event.delta)
+        elif event.type in ("response.completed", "response.incomplete"):
+            self.response = event.response
+
+
+class _RunnerBase:
+    """Response handling shared by the sync and async runners."""
+    
+    config: ModelConfig
+    
+    def _build_request_templates(self) -> None:
+        """Build the per-config request kwargs once, leaving only the prompt per call."""
+        config = self.config
+        self._chat_request = {
+            "model": config.model_id,
+            "temperature": 0.7,
+            "max_tokens": 1024,
+        }
+        self._responses_request = {
+            "model": config.model_id,
+            "instructions": SYSTEM_CITATION_PROMPT,
+            "reasoning": {"effort": config.reasoning_effort},
+            "text": {"format": {"type": "text"}},
+            "stream": config.stream,
+        }
+    
+    def _chat_result(self, question: str, context: str, response, start_time: float) -> ModelResponse:
+        """Build a ModelResponse from a Chat Completions API response."""
+        latency_ms = (time.perf_counter() - start_time) * 1000
         input_tokens = response.usage.prompt_tokens
         output_tokens = response.usage.completion_tokens
         
@@ -95,24 +232,23 @@ class ModelRunner:
             cost=self._calculate_cost(input_tokens, output_tokens),
         )
     
-    def _run_responses(self, question: str, context: str, start_time: float) -> ModelResponse:
-        """Run using Responses API (GPT-5 models)."""
-        user_message = f"Context:\n{context}\n\nQuestion: {question}"
-        
-        response = self.client.responses.create(
-            model=self.config.model_id,
-            instructions=SYSTEM_CITATION_PROMPT,
-            input=user_message,
-            reasoning={"effort": self.config.reasoning_effort},
-            text={"format": {"type": "text"}},
-        )
-        
-        latency_ms = (time.time() - start_time) * 1000
+    def _responses_result(
+        self,
+        question: str,
+        context: str,
+        response,
+        start_time: float,
+        response_text: str | None = None,
+        ttft_ms: float | None = None,
+    ) -> ModelResponse:
+        """Build a ModelResponse from a Responses API response."""
+        latency_ms = (time.perf_counter() - start_time) * 1000
         input_tokens = response.usage.input_tokens
         output_tokens = response.usage.output_tokens
         
-        # Extract text from response
-        response_text = self._extract_response_text(response)
+        # Extract text from response unless it was assembled from a stream
+        if response_text is None:
+            response_text = self._extract_response_text(response)
         
         if not response_text.strip():
             return self._error_response(
@@ -128,22 +264,67 @@ class ModelRunner:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cost=self._calculate_cost(input_tokens, output_tokens),
+            ttft_ms=ttft_ms,
+        )
+    
+    def _stream_result(self, question: str, context: str, stream: _ResponseStream) -> ModelResponse:
+        """Build a ModelResponse from a fully consumed response stream."""
+        if stream.response is None:
+            raise RuntimeError("Response stream ended without a completed response")
+        return self._responses_result(
+            question, context, stream.response, stream.start_time,
+            response_text="".join(stream.parts), ttft_ms=stream.ttft_ms,
+        )
+    
+    def batch_request(self, question: str, context: str) -> tuple[str, dict]:
+        """Endpoint and JSON body for one question as a Batch API request line."""
+        if self.config.api_type == CHAT_COMPLETIONS_API:
+            return "/v1/chat/completions", {"messages": _chat_messages(question, context), **self._chat_request}
+        body = {"input": _responses_input(question, context), **self._responses_request}
+        # Batch jobs return whole responses; streaming is not supported
+        del body["stream"]
+        return "/v1/responses", body
+    
+    def batch_result(self, question: str, context: str, body: dict) -> ModelResponse:
+        """
+        Build a ModelResponse from a Batch API response body.
+        
+        Batched calls have no per-request latency, so latency_ms is None; cost
+        is billed at the batch discount.
+        """
+        usage = body.get("usage") or {}
+        if self.config.api_type == CHAT_COMPLETIONS_API:
+            choices = body.get("choices") or [{}]
+            response_text = (choices[0].get("message") or {}).get("content") or ""
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+        else:
+            response_text = output_text_from_body(body)
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+        
+        if not response_text.strip():
+            return self._error_response(question, context, "Empty response in batch output")
+        
+        return ModelResponse(
+            model_name=self.config.name,
+            question=question,
+            context=context,
+            response=response_text,
+            latency_ms=None,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost=self._calculate_cost(input_tokens, output_tokens) * BATCH_PRICE_MULTIPLIER,
         )
     
     def _extract_response_text(self, response) -> str:
         """Extract text content from the Responses API response."""
-        for item in response.output:
-            if item.type == "message":
-                for content in item.content:
-                    if content.type == "output_text":
-                        return content.text
-        return ""
+        return first_output_text(response)
     
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost in USD."""
-        input_cost = (input_tokens / 1_000_000) * self.config.input_price_per_million
-        output_cost = (output_tokens / 1_000_000) * self.config.output_price_per_million
-        return input_cost + output_cost
+        config = self.config
+        return input_tokens * config.input_cost_per_token + output_tokens * config.output_cost_per_token
     
     def _error_response(self, question: str, context: str, error: str) -> ModelResponse:
         """Create an error response."""
@@ -160,7 +341,182 @@ class ModelRunner:
         )
 
 
-class AsyncModelRunner:
+class ModelRunner(_RunnerBase):
+    """Synchronous model runner."""
+    
+    def __init__(self, config: ModelConfig, client: OpenAI | None = None):
+        self.config = config
+        self.client = client or OpenAI()
+        self._build_request_templates()
+        self.max_retries = 3
+        self.base_retry_delay = 1
+    
+    def run(self, question: str, context: str) -> ModelResponse:
+        """Run a single question through the model."""
+        last_error = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                # Reset start time for each attempt so latency reflects only the successful call
+                start_time = time.perf_counter()
+                
+                if self.config.api_type == CHAT_COMPLETIONS_API:
+                    return self._run_chat_completions(question, context, start_time)
+                else:
+                    return self._run_responses(question, context, start_time)
+                    
+            except Exception as e:
+                last_error = str(e)
+                if attempt < self.max_retries - 1:
+                    time.sleep(retry_delay(e, attempt, self.base_retry_delay))
+        
+        return self._error_response(question, context, last_error or "Max retries exceeded")
+    
+    def _run_chat_completions(self, question: str, context: str, start_time: float) -> ModelResponse:
+        """Run using Chat Completions API (GPT-4o-mini)."""
+        response = self.client.chat.completions.create(
+            messages=_chat_messages(question, context), **self._chat_request
+        )
+        return self._chat_result(question, context, response, start_time)
+    
+    def _run_responses(self, question: str, context: str, start_time: float) -> ModelResponse:
+        """Run using Responses API (GPT-5 models)."""
+        response = self.client.responses.create(
+            input=_responses_input(question, context), **self._responses_request
+        )
+        if not self.config.stream:
+            return self._responses_result(question, context, response, start_time)
+        
+        stream = _ResponseStream(start_time)
+        for event in response:
+            stream.feed(event)
+        return self._stream_result(question, context, stream)
+
+
+class RateLimiter:
+    """
+    Request/token rate limiter with AIMD concurrency control.
+    
+    One instance can be shared by several AsyncModelRunner instances so
+    that all of them stay under the same account-wide RPM/TPM budget.
+    Requests and token counts are tracked in 60-second sliding windows;
+    token estimates taken at acquire time are corrected with the real
+    usage once the response arrives. The concurrency limit is halved on
+    every 429 and grows additively after every successful call.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    
+    def __init__(
+        self,
+        rpm: int = 60,
+        tpm: int = 150_000,
+        max_concurrent: int = 10,
+        min_concurrent: int = 1,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrent = max_concurrent
+        self.min_concurrent = min_concurrent
+        self.limit = float(max_concurrent)
+        self._in_flight = 0
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+        self._condition = asyncio.Condition()
+    
+    def _expire(self, now: float) -> None:
+        """Drop requests and tokens that have left the sliding window."""
+        cutoff = now - self.WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
+    
+    def _wait_time(self, now: float, estimated_tokens: int) -> float:
+        """Seconds until a request of this size fits the RPM/TPM budget."""
+        wait = 0.0
+        if self.rpm and len(self._requests) >= self.rpm:
+            wait = self._requests[0] + self.WINDOW_SECONDS - now
+        if self.tpm and self._tokens and self._token_total + estimated_tokens > self.tpm:
+            wait = max(wait, self._tokens[0][0] + self.WINDOW_SECONDS - now)
+        return max(wait, 0.0)
+    
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """Wait for a concurrency slot and room in the rate windows."""
+        async with self._condition:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                wait = self._wait_time(now, estimated_tokens)
+                if not wait and self._in_flight < int(self.limit):
+                    break
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=wait or None)
+                except TimeoutError:
+                    pass
+            
+            self._in_flight += 1
+            self._requests.append(now)
+            self._tokens.append((now, estimated_tokens))
+            self._token_total += estimated_tokens
+    
+    async def release(
+        self,
+        estimated_tokens: int = 0,
+        used_tokens: int | None = None,
+        rate_limited: bool = False,
+    ) -> None:
+        """
+        Free a slot, account the real token usage and adjust the limit.
+        
+        ``used_tokens`` is only given for successful calls, which are the
+        ones that grow the limit.
+        """
+        # Free the slot before taking the lock, so a cancellation while
+        # waiting for it cannot leak the slot
+        self._in_flight -= 1
+        async with self._condition:
+            if used_tokens is not None and used_tokens != estimated_tokens:
+                correction = used_tokens - estimated_tokens
+                self._tokens.append((time.monotonic(), correction))
+                self._token_total += correction
+            
+            if rate_limited:
+                self.limit = max(float(self.min_concurrent), self.limit / 2)
+            elif used_tokens is not None:
+                self.limit = min(float(self.max_concurrent), self.limit + 1 / self.limit)
+            
+            self._condition.notify_all()
+
+
+def model_limiters(
+    configs: Iterable[ModelConfig],
+    default: RateLimiter | None = None,
+    max_concurrent: int = 10,
+) -> dict[str, RateLimiter | None]:
+    """
+    Pick the rate limiter for each config, keyed by config name.
+    
+    Configs with their own rpm_limit/tpm_limit get one limiter per model_id,
+    so reasoning-effort variants of a model draw from that model's budget;
+    the rest use ``default``.
+    """
+    by_model_id: dict[str, RateLimiter] = {}
+    limiters = {}
+    for config in configs:
+        if not (config.rpm_limit or config.tpm_limit):
+            limiters[config.name] = default
+            continue
+        limiter = by_model_id.get(config.model_id)
+        if limiter is None:
+            limiter = RateLimiter(rpm=config.rpm_limit, tpm=config.tpm_limit, max_concurrent=max_concurrent)
+            by_model_id[config.model_id] = limiter
+        limiters[config.name] = limiter
+    return limiters
+
+
+class AsyncModelRunner(_RunnerBase):
     """Asynchronous model runner with bounded concurrency."""
     
     def __init__(
@@ -168,24 +524,49 @@ class AsyncModelRunner:
         config: ModelConfig,
         client: AsyncOpenAI | None = None,
         max_concurrent: int = 10,
+        limiter: RateLimiter | None = None,
+        cache: "ResponseCache | None" = None,
+        semaphore: asyncio.Semaphore | None = None,
     ):
         self.config = config
-        self.client = client or AsyncOpenAI()
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.client = client or get_async_client()
+        self._build_request_templates()
+        # Runners given the same semaphore share one in-flight budget
+        self.semaphore = semaphore or asyncio.Semaphore(max_concurrent)
+        self.limiter = limiter
+        self.cache = cache
         self.max_retries = 3
-        self.retry_delay = 5
+        self.base_retry_delay = 1
     
     async def run(self, question: str, context: str) -> ModelResponse:
         """Run a single question through the model with bounded concurrency."""
+        if self.cache is None:
+            return await self._run_uncached(question, context)
+        
+        cached = self.cache.get(self.config, question, context)
+        if cached is not None:
+            return cached
+        if self.cache.replay:
+            return self._error_response(question, context, "Not in response cache (replay mode)")
+        
+        result = await self._run_uncached(question, context)
+        self.cache.put(self.config, result)
+        return result
+    
+    async def _run_uncached(self, question: str, context: str) -> ModelResponse:
+        """Call the API for one question, retrying failures."""
         async with self.semaphore:
             last_error = None
             
             for attempt in range(self.max_retries):
                 try:
+                    if self.limiter is not None:
+                        return await self._run_limited(question, context)
+                    
                     # Reset start time for each attempt so latency reflects only the successful call
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     
-                    if self.config.api_type == "chat_completions":
+                    if self.config.api_type == CHAT_COMPLETIONS_API:
                         return await self._run_chat_completions(question, context, start_time)
                     else:
                         return await self._run_responses(question, context, start_time)
@@ -193,111 +574,78 @@ class AsyncModelRunner:
                 except Exception as e:
                     last_error = str(e)
                     if attempt < self.max_retries - 1:
-                        await asyncio.sleep(self.retry_delay)
+                        await asyncio.sleep(retry_delay(e, attempt, self.base_retry_delay))
             
             return self._error_response(question, context, last_error or "Max retries exceeded")
     
+    async def _run_limited(self, question: str, context: str) -> ModelResponse:
+        """Run one attempt through the shared rate limiter."""
+        estimated_tokens = (len(SYSTEM_CITATION_PROMPT) + len(context) + len(question)) // 4
+        await self.limiter.acquire(estimated_tokens)
+        
+        used_tokens = None
+        rate_limited = False
+        try:
+            start_time = time.perf_counter()
+            if self.config.api_type == CHAT_COMPLETIONS_API:
+                result = await self._run_chat_completions(question, context, start_time)
+            else:
+                result = await self._run_responses(question, context, start_time)
+            used_tokens = result.input_tokens + result.output_tokens
+            return result
+        except RateLimitError:
+            rate_limited = True
+            raise
+        finally:
+            # Also runs on cancellation, so the slot is never leaked
+            await self.limiter.release(estimated_tokens, used_tokens=used_tokens, rate_limited=rate_limited)
+    
     async def _run_chat_completions(self, question: str, context: str, start_time: float) -> ModelResponse:
         """Run using Chat Completions API (GPT-4o-mini)."""
-        messages = [
-            {"role": "system", "content": SYSTEM_CITATION_PROMPT},
-            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"}
-        ]
-        
         response = await self.client.chat.completions.create(
-            model=self.config.model_id,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=1024,
-        )
-        
-        latency_ms = (time.time() - start_time) * 1000
-        input_tokens = response.usage.prompt_tokens
-        output_tokens = response.usage.completion_tokens
-        
-        response_text = response.choices[0].message.content or ""
-        
-        if not response_text.strip():
-            return self._error_response(
-                question, context, "Empty response from chat completions API"
-            )
-        
-        return ModelResponse(
-            model_name=self.config.name,
-            question=question,
-            context=context,
-            response=response_text,
-            latency_ms=latency_ms,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost=self._calculate_cost(input_tokens, output_tokens),
+            messages=_chat_messages(question, context), **self._chat_request
         )
+        return self._chat_result(question, context, response, start_time)
     
     async def _run_responses(self, question: str, context: str, start_time: float) -> ModelResponse:
         """Run using Responses API (GPT-5 models)."""
-        user_message = f"Context:\n{context}\n\nQuestion: {question}"
-        
         response = await self.client.responses.create(
-            model=self.config.model_id,
-            instructions=SYSTEM_CITATION_PROMPT,
-            input=user_message,
-            reasoning={"effort": self.config.reasoning_effort},
-            text={"format": {"type": "text"}},
+            input=_responses_input(question, context), **self._responses_request
         )
+        if not self.config.stream:
+            return self._responses_result(question, context, response, start_time)
         
-        latency_ms = (time.time() - start_time) * 1000
-        input_tokens = response.usage.input_tokens
-        output_tokens = response.usage.output_tokens
-        
-        # Extract text from response
-        response_text = self._extract_response_text(response)
-        
-        if not response_text.strip():
-            return self._error_response(
-                question, context, "No output_text found in responses API response"
-            )
-        
-        return ModelResponse(
-            model_name=self.config.name,
-            question=question,
-            context=context,
-            response=response_text,
-            latency_ms=latency_ms,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost=self._calculate_cost(input_tokens, output_tokens),
-        )
-    
-    def _extract_response_text(self, response) -> str:
-        """Extract text content from the Responses API response."""
-        for item in response.output:
-            if item.type == "message":
-                for content in item.content:
-                    if content.type == "output_text":
-                        return content.text
-        return ""
+        stream = _ResponseStream(start_time)
+        async for event in response:
+            stream.feed(event)
+        return self._stream_result(question, context, stream)
     
-    def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
-        """Calculate cost in USD."""
-        input_cost = (input_tokens / 1_000_000) * self.config.input_price_per_million
-        output_cost = (output_tokens / 1_000_000) * self.config.output_price_per_million
-        return input_cost + output_cost
+    async def run_batch(self, questions: Iterable[tuple[str, str]]) -> list[ModelResponse]:
+        """Run a batch of (question, context) pairs concurrently."""
+        tasks = [self.run(q, c) for q, c in questions]
+        return await asyncio.gather(*tasks)
+
+
+async def run_multi_model(
+    runners: list[AsyncModelRunner],
+    questions: list[tuple[str, str]],
+    on_model_done: Callable[[str, list[ModelResponse]], None] | None = None,
+) -> dict[str, list[ModelResponse]]:
+    """
+    Run every question through every runner at the same time.
     
-    def _error_response(self, question: str, context: str, error: str) -> ModelResponse:
-        """Create an error response."""
-        return ModelResponse(
-            model_name=self.config.name,
-            question=question,
-            context=context,
-            response="",
-            latency_ms=0,
-            input_tokens=0,
-            output_tokens=0,
-            cost=0,
-            error=error,
-        )
+    Slow reasoning models overlap with fast ones instead of running one
+    model after another; give the runners a shared semaphore to cap the
+    total number of in-flight calls. ``on_model_done`` is called with each
+    model's name and responses as soon as that model finishes. Results are
+    keyed by model name and keep the question order.
+    """
+    async def run_model(runner: AsyncModelRunner) -> list[ModelResponse]:
+        responses = await runner.run_batch(questions)
+        if on_model_done is not None:
+            on_model_done(runner.config.name, responses)
+        return responses
     
-    async def run_batch(self, questions: list[tuple[str, str]]) -> list[ModelResponse]:
-        """Run a batch of questions concurrently."""
-        tasks = [self.run(q, c) for q, c in questions]
-        return await asyncio.gather(*tasks)
\ No newline at end of file
+    async with asyncio.TaskGroup() as tg:
+        tasks = {runner.config.name: tg.create_task(run_model(runner)) for runner in runners}
+    return {name: task.result() for name, task in tasks.items()}
@@ -18,22 +18,62 @@ Usage:
 import argparse
 import asyncio
 import csv
+import gzip
+import hashlib
 import json
 import os
+import re
+import shutil
 import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop; not available on Windows
+    uvloop = None
+
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
-from config import ALL_MODELS, MODELS_BY_NAME, ModelConfig, GRADER_MODEL, GRADER_REASONING_EFFORT
-from grader import Grader, GradingResult
-from model_runner import AsyncModelRunner, ModelResponse
+from batch_runner import run_batch_evaluation
+from cache import GradeCache, ResponseCache, RunCheckpoint
+from config import (
+    ALL_MODELS,
+    GRADER_MODEL,
+    GRADER_REASONING_EFFORT,
+    MODELS_BY_ID,
+    MODELS_BY_NAME,
+    RESPONSES_API,
+    ModelConfig,
+    find_model,
+)
+from dedup import paraphrase_canonicals
+from grader import AsyncGrader, GradingResult, error_result
+from model_runner import (
+    AsyncModelRunner,
+    ModelResponse,
+    RateLimiter,
+    close_async_client,
+    get_async_client,
+    model_limiters,
+    run_multi_model,
+)
 
 # Load environment variables from .env file
 load_dotenv()
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def list_available_models():
     """Print all available models."""
@@ -45,189 +85,411 @@ def list_available_models():
     print("   • GPT-4o-mini")
     
     print("\n🔬 GPT-5-mini Variants (6):")
-    for m in ALL_MODELS:
-        if m.model_id == "gpt-5-mini":
-            print(f"   • {m.name}")
+    for m in MODELS_BY_ID["gpt-5-mini"]:
+        print(f"   • {m.name}")
     
     print("\n🔬 GPT-5-nano Variants (6):")
-    for m in ALL_MODELS:
-        if m.model_id == "gpt-5-nano":
-            print(f"   • {m.name}")
+    for m in MODELS_BY_ID["gpt-5-nano"]:
+        print(f"   • {m.name}")
     
     print("\n" + "=" * 60 + "\n")
 
 
-def load_langfuse_data(csv_path: str, max_samples: int | None = None) -> list[dict]:
-    """Load questions from Langfuse CSV export.
+# Tool-call traces ("args"/"kwargs" in the input) aren't user questions;
+# "kwargs" contains "args", so one case-insensitive search covers both
+_BAD_ROW_RE = re.compile(r"args", re.IGNORECASE)
+
+
+def _iter_questions(
+    reader: Iterator[list[str]],
+    input_idx: int,
+    context_source: str | None,
+    context_idx: int | None,
+    metadata_idx: int | None,
+    id_idx: int | None,
+) -> Iterator[dict]:
+    """Yield valid questions from Langfuse CSV rows, skipping bad rows."""
+    # Short rows are padded so every column index below is valid
+    width = max(i for i in (input_idx, context_idx, metadata_idx, id_idx) if i is not None) + 1
+    padding = [""] * width
+    
+    for row in reader:
+        if len(row) < width:
+            row += padding[len(row):]
+        input_text = row[input_idx]
+        
+        # Skip bad rows
+        if _BAD_ROW_RE.search(input_text):
+            continue
+        if not input_text.strip():
+            continue
+        
+        # Extract context from appropriate source
+        context = ""
+        if context_source == "context_column":
+            context = row[context_idx]
+        elif context_source == "metadata":
+            metadata_str = row[metadata_idx]
+            if metadata_str:
+                try:
+                    metadata = _json_loads(metadata_str)
+                    context = metadata.get("retrieved_docs", "") or ""
+                except json.JSONDecodeError:
+                    # Try to extract retrieved_docs directly if it's not valid JSON
+                    if "retrieved_docs" in metadata_str:
+                        # Simple extraction for malformed JSON
+                        pass
+        
+        trace_id = row[id_idx] if id_idx is not None else ""
+        
+        yield {
+            "question": input_text.strip(),
+            "context": context.strip() if context else "",
+            "trace_id": trace_id,
+        }
+
+
+def _column_index(fieldnames: list[str], candidates: list[str]) -> int | None:
+    """Index of the first candidate column present in the header, or None."""
+    return next((fieldnames.index(c) for c in candidates if c in fieldnames), None)
+
+
+def iter_langfuse_data(csv_path: str) -> Iterator[dict]:
+    """Yield questions from a Langfuse CSV export one row at a time.
     
     Supports two formats:
     1. CSV with 'context' column directly
     2. Langfuse export with 'metadata' column containing 'retrieved_docs'
-    """
-    questions = []
     
-    # Use utf-8-sig to handle BOM (Byte Order Mark) if present
-    with open(csv_path, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
+    The file is read lazily and closed once the generator is exhausted or
+    closed, so callers that stop early never parse the rest of the export.
+    """
+    # Use utf-8-sig to handle BOM (Byte Order Mark) if present; a 1 MiB
+    # buffer cuts read syscalls on large exports and network-mounted files
+    with open(csv_path, "r", encoding="utf-8-sig", buffering=1 << 20) as f:
+        reader = csv.reader(f)
         
-        # Validate that we have the expected columns
-        fieldnames = reader.fieldnames or []
-        input_col = next((c for c in ["input", "Input"] if c in fieldnames), None)
-        context_col = next((c for c in ["context", "Context"] if c in fieldnames), None)
-        metadata_col = next((c for c in ["metadata", "Metadata"] if c in fieldnames), None)
-        id_col = next((c for c in ["trace_id", "id", "ID"] if c in fieldnames), None)
+        # Resolve column positions once from the header
+        fieldnames = next(reader, [])
+        input_idx = _column_index(fieldnames, ["input", "Input"])
+        context_idx = _column_index(fieldnames, ["context", "Context"])
+        metadata_idx = _column_index(fieldnames, ["metadata", "Metadata"])
+        id_idx = _column_index(fieldnames, ["trace_id", "id", "ID"])
         
-        if not input_col:
+        if input_idx is None:
             print(f"Error: No 'input' or 'Input' column found in CSV.")
             print(f"Available columns: {fieldnames}")
-            return []
+            return
         
         # Determine context source
         context_source = None
-        if context_col:
+        if context_idx is not None:
             context_source = "context_column"
             print(f"Using 'context' column for retrieved documents.")
-        elif metadata_col:
+        elif metadata_idx is not None:
             context_source = "metadata"
             print(f"Extracting 'retrieved_docs' from 'metadata' column.")
         else:
             print(f"Warning: No 'context' or 'metadata' column found. Using empty context.")
         
-        for row in reader:
-            input_text = row.get(input_col, "") or ""
-            
-            # Skip bad rows
-            if "args" in input_text.lower() or "kwargs" in input_text.lower():
-                continue
-            if not input_text.strip():
-                continue
-            
-            # Extract context from appropriate source
-            context = ""
-            if context_source == "context_column":
-                context = row.get(context_col, "") or ""
-            elif context_source == "metadata":
-                metadata_str = row.get(metadata_col, "") or ""
-                if metadata_str:
-                    try:
-                        metadata = json.loads(metadata_str)
-                        context = metadata.get("retrieved_docs", "") or ""
-                    except json.JSONDecodeError:
-                        # Try to extract retrieved_docs directly if it's not valid JSON
-                        if "retrieved_docs" in metadata_str:
-                            # Simple extraction for malformed JSON
-                            pass
-            
-            trace_id = row.get(id_col, "") if id_col else ""
-            
-            questions.append({
-                "question": input_text.strip(),
-                "context": context.strip() if context else "",
-                "trace_id": trace_id,
-            })
-            
-            if max_samples and len(questions) >= max_samples:
-                break
+        yield from _iter_questions(reader, input_idx, context_source, context_idx, metadata_idx, id_idx)
+
+
+def load_langfuse_data(csv_path: str, max_samples: int | None = None) -> list[dict]:
+    """Load up to max_samples valid questions from a Langfuse CSV export."""
+    questions = []
+    with_context = 0
+    rows = iter_langfuse_data(csv_path)
+    # Stop reading as soon as enough valid rows have been found
+    for q in islice(rows, max_samples or None):
+        questions.append(q)
+        if q["context"]:
+            with_context += 1
+    rows.close()
     
     # Report stats
-    with_context = sum(1 for q in questions if q["context"])
     print(f"Loaded {len(questions)} valid questions from {csv_path}")
     print(f"  - {with_context}/{len(questions)} questions have context")
     
     return questions
 
 
-def get_model_key(model: ModelConfig) -> str:
-    """Generate a unique key for a model."""
-    if model.reasoning_effort and model.verbosity:
-        return f"{model.model_id}_{model.reasoning_effort}_{model.verbosity}"
-    return model.model_id
+@dataclass(slots=True, frozen=True)
+class Questions:
+    """Loaded questions stored column-wise, built once and shared by every model."""
+    text: tuple[str, ...]
+    context: tuple[str, ...]
+    trace_id: tuple[str, ...]
+    # Distinct (question, context) pairs, and each question's index into them
+    unique_pairs: list[tuple[str, str]] = field(init=False, repr=False)
+    order: tuple[int, ...] = field(init=False, repr=False)
+    # Paraphrase mapping applied by merged(), or None when only exact duplicates are shared
+    canonical: tuple[int, ...] | None = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        # Repeated traces of the same question are only sent to the API once
+        unique: dict[tuple[str, str], int] = {}
+        order = tuple(unique.setdefault(pair, len(unique)) for pair in zip(self.text, self.context))
+        object.__setattr__(self, "unique_pairs", list(unique))
+        object.__setattr__(self, "order", order)
+    
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "Questions":
+        return cls(
+            text=tuple(q["question"] for q in rows),
+            context=tuple(q.get("context", "") for q in rows),
+            trace_id=tuple(q.get("trace_id", "") for q in rows),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.text)
+    
+    def digest(self) -> str:
+        """Fingerprint of the question set and any paraphrase merging, used to match checkpoints to it."""
+        h = hashlib.blake2b(digest_size=16)
+        for question, context in zip(self.text, self.context):
+            h.update(f"{question}\x00{context}\x00".encode())
+        if self.canonical is not None:
+            # Responses were produced per cluster, so another clustering needs another shard
+            h.update(b"canonical\x00" + ",".join(map(str, self.canonical)).encode())
+        return h.hexdigest()
+    
+    def merged(self, canonical: Sequence[int]) -> "Questions":
+        """
+        Return a copy where unique pair j is answered by unique pair canonical[j].
+        
+        Every question keeps its own text and context in the output and for
+        grading; only the model call is shared with its canonical pair.
+        """
+        merged = replace(self)
+        kept: dict[int, int] = {}
+        remap = [kept.setdefault(c, len(kept)) for c in canonical]
+        object.__setattr__(merged, "unique_pairs", [self.unique_pairs[c] for c in kept])
+        object.__setattr__(merged, "order", tuple(remap[j] for j in self.order))
+        object.__setattr__(merged, "canonical", tuple(canonical))
+        return merged
+    
+    def scatter(self, unique_results: list) -> list:
+        """Expand results computed per unique pair back to one per question."""
+        return [unique_results[j] for j in self.order]
+
+
+def print_run_summary(responses: list[ModelResponse]) -> None:
+    """Print success rate, latency, cost and sample errors for one model run."""
+    num_successful = 0
+    num_timed = 0
+    total_cost = 0.0
+    total_latency = 0.0
+    unique_errors = []
+    for r in responses:
+        if r.error is None:
+            num_successful += 1
+            total_cost += r.cost
+            if r.latency_ms is not None:
+                num_timed += 1
+                total_latency += r.latency_ms
+        elif r.error and r.error not in unique_errors and len(unique_errors) < 3:
+            unique_errors.append(r.error)
+    
+    if num_successful:
+        print(f"   ✓ {num_successful}/{len(responses)} successful")
+        if num_timed:
+            print(f"   ⏱ Avg latency: {total_latency / num_timed:.0f}ms")
+        else:
+            print("   ⏱ Avg latency: not measured")
+        print(f"   💰 Total cost: ${total_cost:.4f}")
+    else:
+        print(f"   ✗ All {len(responses)} requests failed")
+    
+    # Show up to 3 unique errors for debugging
+    for error in unique_errors:
+        print(f"   ⚠ Error: {error[:100]}...")
+
+
+def split_model_names(spec: str) -> list[str]:
+    """Split a --models value on commas, keeping commas inside "(effort, verbosity)"."""
+    names = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(spec):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth = max(0, depth - 1)
+        elif ch == "," and depth == 0:
+            names.append(spec[start:i])
+            start = i + 1
+    names.append(spec[start:])
+    return [name.strip() for name in names if name.strip()]
+
+
+def parse_model_limits(spec: str) -> dict[str, tuple[int, int]]:
+    """
+    Parse a --model-limits value like "gpt-5-mini=500:200000,gpt-4o-mini=5000:0".
+    
+    Keys are OpenAI model ids and values are RPM:TPM, with 0 meaning no
+    limit on that axis. Raises ValueError on a malformed entry.
+    """
+    limits = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        model_id, sep, values = entry.partition("=")
+        rpm, colon, tpm = values.partition(":")
+        if not (sep and colon and model_id.strip()):
+            raise ValueError(f"expected MODEL_ID=RPM:TPM, got '{entry.strip()}'")
+        try:
+            limits[model_id.strip()] = (int(rpm), int(tpm))
+        except ValueError:
+            raise ValueError(f"RPM and TPM must be integers in '{entry.strip()}'") from None
+    return limits
 
 
 async def run_model_evaluation(
     model: ModelConfig,
-    questions: list[dict],
+    questions: Questions,
     max_concurrent: int = 10,
+    limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    client: AsyncOpenAI | None = None,
 ) -> list[ModelResponse]:
     """Run evaluation for a single model across all questions."""
-    client = AsyncOpenAI()
-    runner = AsyncModelRunner(model, client, max_concurrent)
+    runner = AsyncModelRunner(model, client or get_async_client(), max_concurrent, limiter=limiter, cache=cache)
     
     print(f"\n🔄 Running {model.name} on {len(questions)} questions...")
     
-    question_context_pairs = [
-        (q["question"], q.get("context", "")) for q in questions
-    ]
-    
-    responses = await runner.run_batch(question_context_pairs)
-    
-    # Print summary
-    successful = [r for r in responses if r.error is None]
-    failed = [r for r in responses if r.error is not None]
-    
-    if successful:
-        total_cost = sum(r.cost for r in successful)
-        avg_latency = sum(r.latency_ms for r in successful) / len(successful)
-        print(f"   ✓ {len(successful)}/{len(responses)} successful")
-        print(f"   ⏱ Avg latency: {avg_latency:.0f}ms")
-        print(f"   💰 Total cost: ${total_cost:.4f}")
-    else:
-        print(f"   ✗ All {len(responses)} requests failed")
-    
-    if failed:
-        # Show first unique error for debugging
-        unique_errors = set(r.error for r in failed if r.error)
-        for error in list(unique_errors)[:3]:  # Show up to 3 unique errors
-            print(f"   ⚠ Error: {error[:100]}...")
+    responses = questions.scatter(await runner.run_batch(questions.unique_pairs))
+    print_run_summary(responses)
     
     return responses
 
 
-def grade_responses(
-    questions: list[dict],
+async def grade_responses(
+    questions: Questions,
     responses: list[ModelResponse],
-    grader: Grader,
+    grader: AsyncGrader,
     model_name: str,
+    group_size: int = 1,
 ) -> list[GradingResult]:
-    """Grade all responses for a model."""
+    """Grade all responses for a model concurrently, group_size responses per grader call."""
     print(f"   📝 Grading {model_name} responses...")
     
+    # Failed model calls are not sent to the grader
+    text = questions.text
+    context = questions.context
+    to_grade = [
+        (text[i], context[i], r.response)
+        for i, r in enumerate(responses)
+        if not r.error
+    ]
+    if group_size > 1:
+        graded = await grader.grade_combined(to_grade, group_size)
+    else:
+        graded = await grader.grade_batch(to_grade)
+    return _merge_grades(responses, iter(graded), model_name)
+
+
+async def grade_responses_offline(
+    questions: Questions,
+    model_responses: list[tuple[str, list[ModelResponse]]],
+    grader: AsyncGrader,
+) -> list[list[GradingResult]]:
+    """Grade several models' (name, responses) in one grader Batch API job."""
+    print(f"\n📝 Grading {len(model_responses)} models' responses through the Batch API...")
+    
+    text = questions.text
+    context = questions.context
+    to_grade = [
+        (text[i], context[i], r.response)
+        for _, responses in model_responses
+        for i, r in enumerate(responses)
+        if not r.error
+    ]
+    graded = iter(await grader.grade_batch_offline(to_grade))
+    return [_merge_grades(responses, graded, model_name) for model_name, responses in model_responses]
+
+
+def _merge_grades(
+    responses: list[ModelResponse],
+    graded: Iterator[GradingResult],
+    model_name: str,
+) -> list[GradingResult]:
+    """Line grades of the successful responses back up with every response, failed ones included."""
     grades = []
     error_count = 0
+    num_graded = 0
+    # Grades are immutable, so bursts of one failure (rate limits, timeouts) share one
+    error_grades: dict[str, GradingResult] = {}
     
-    for i, (q, r) in enumerate(zip(questions, responses)):
+    for r in responses:
         if r.error:
-            grades.append(GradingResult(
-                on_topic=1, grounded=1, no_contradiction=1,
-                understandability=1, overall=1, error=r.error
-            ))
+            grade = error_grades.get(r.error)
+            if grade is None:
+                grade = error_grades[r.error] = error_result(r.error)
+            grades.append(grade)
             error_count += 1
         else:
-            grade = grader.grade(q["question"], q.get("context", ""), r.response)
+            grade = next(graded)
             grades.append(grade)
+            num_graded += 1
             if grade.error:
                 error_count += 1
-        
-        if (i + 1) % 25 == 0:
-            print(f"      Graded {i + 1}/{len(responses)}")
     
+    print(f"      Graded {model_name}: {num_graded}/{len(responses)}")
     if error_count > 0:
-        print(f"      ⚠ {error_count} grading errors")
+        print(f"      ⚠ {model_name}: {error_count} grading errors")
     
     return grades
 
 
+async def run_and_grade(
+    runner: AsyncModelRunner,
+    grader: AsyncGrader,
+    items: list[tuple[str, str]],
+) -> list[tuple[ModelResponse, GradingResult]]:
+    """
+    Run and grade each question as a single pipeline.
+    
+    A question is sent to the grader as soon as its model response arrives,
+    so grading overlaps with generation of the remaining questions instead
+    of waiting for the whole batch.
+    """
+    async def run_one(question: str, context: str) -> tuple[ModelResponse, GradingResult]:
+        response = await runner.run(question, context)
+        if response.error:
+            return response, error_result(response.error)
+        return response, await grader.grade(question, context, response.response)
+    
+    return await asyncio.gather(*(run_one(q, c) for q, c in items))
+
+
 def build_model_summary(
     model: ModelConfig,
     responses: list[ModelResponse],
     grades: list[GradingResult],
 ) -> dict:
     """Build summary stats for a single model."""
-    successful = [r for r in responses if r.error is None]
-    valid_grades = [g for g in grades if g.error is None]
+    # Token usage, cost and latency of successful responses in a single pass
+    total_input_tokens = 0
+    total_output_tokens = 0
+    total_cost = 0.0
+    total_latency = 0.0
+    num_successful = 0
+    # Batch API results have no latency and are left out of these stats
+    latencies = []
+    for r in responses:
+        if r.error is not None:
+            continue
+        num_successful += 1
+        total_input_tokens += r.input_tokens
+        total_output_tokens += r.output_tokens
+        total_cost += r.cost
+        if r.latency_ms is not None:
+            total_latency += r.latency_ms
+            latencies.append(r.latency_ms)
     
     # Handle case where all responses failed
-    if not successful:
+    if not num_successful:
         return {
             "name": model.name,
             "model_id": model.model_id,
@@ -245,7 +507,10 @@ def build_model_summary(
                 "overall": 0,
             },
             "avg_latency_ms": 0,
+            "p50_latency_ms": 0,
+            "p90_latency_ms": 0,
             "p95_latency_ms": 0,
+            "p99_latency_ms": 0,
             "usage": {
                 "total_input_tokens": 0,
                 "total_output_tokens": 0,
@@ -267,25 +532,33 @@ def build_model_summary(
             },
         }
     
-    # Token usage
-    total_input_tokens = sum(r.input_tokens for r in successful)
-    total_output_tokens = sum(r.output_tokens for r in successful)
-    total_cost = sum(r.cost for r in successful)
-    
-    # Latency stats
-    latencies = sorted([r.latency_ms for r in successful])
-    avg_latency = sum(latencies) / len(latencies)
-    p95_idx = int(len(latencies) * 0.95)
-    p95_latency = latencies[min(p95_idx, len(latencies) - 1)]
-    
-    # Score stats
-    avg_score = sum(g.average for g in valid_grades) / len(valid_grades) if valid_grades else 0
+    # Latency stats; every percentile reads from one sort. None when nothing was timed
+    if latencies:
+        avg_latency = round(total_latency / len(latencies), 1)
+        latencies.sort()
+        last = len(latencies) - 1
+        p50_latency, p90_latency, p95_latency, p99_latency = (
+            round(latencies[min(int(len(latencies) * q), last)], 1) for q in (0.50, 0.90, 0.95, 0.99)
+        )
+    else:
+        avg_latency = p50_latency = p90_latency = p95_latency = p99_latency = None
     
-    def avg_dimension(attr: str) -> float:
-        vals = [getattr(g, attr) for g in valid_grades]
-        return sum(vals) / len(vals) if vals else 0
+    # Score stats: all five dimensions summed in one pass
+    on_topic = grounded = no_contradiction = understandability = overall = 0
+    num_grades = 0
+    for g in grades:
+        if g.error is not None:
+            continue
+        num_grades += 1
+        on_topic += g.on_topic
+        grounded += g.grounded
+        no_contradiction += g.no_contradiction
+        understandability += g.understandability
+        overall += g.overall
+    scale = 1 / num_grades if num_grades else 0
+    avg_score = (on_topic + grounded + no_contradiction + understandability + overall) * scale / 5
     
-    num_queries = len(successful)
+    num_queries = num_successful
     
     return {
         "name": model.name,
@@ -293,20 +566,23 @@ def build_model_summary(
         "api_type": model.api_type,
         "reasoning_effort": model.reasoning_effort,
         "verbosity": model.verbosity,
-        "successful_responses": len(successful),
+        "successful_responses": num_queries,
         "total_responses": len(responses),
         # Scores
         "avg_score": round(avg_score, 3),
         "scores": {
-            "on_topic": round(avg_dimension("on_topic"), 3),
-            "grounded": round(avg_dimension("grounded"), 3),
-            "no_contradiction": round(avg_dimension("no_contradiction"), 3),
-            "understandability": round(avg_dimension("understandability"), 3),
-            "overall": round(avg_dimension("overall"), 3),
+            "on_topic": round(on_topic * scale, 3),
+            "grounded": round(grounded * scale, 3),
+            "no_contradiction": round(no_contradiction * scale, 3),
+            "understandability": round(understandability * scale, 3),
+            "overall": round(overall * scale, 3),
         },
         # Latency
-        "avg_latency_ms": round(avg_latency, 1),
-        "p95_latency_ms": round(p95_latency, 1),
+        "avg_latency_ms": avg_latency,
+        "p50_latency_ms": p50_latency,
+        "p90_latency_ms": p90_latency,
+        "p95_latency_ms": p95_latency,
+        "p99_latency_ms": p99_latency,
         # Token usage
         "usage": {
             "total_input_tokens": total_input_tokens,
@@ -317,8 +593,8 @@ def build_model_summary(
         },
         # Costs
         "costs": {
-            "input_cost": round((total_input_tokens / 1_000_000) * model.input_price_per_million, 6),
-            "output_cost": round((total_output_tokens / 1_000_000) * model.output_price_per_million, 6),
+            "input_cost": round(total_input_tokens * model.input_cost_per_token, 6),
+            "output_cost": round(total_output_tokens * model.output_cost_per_token, 6),
             "total_cost": round(total_cost, 6),
             "cost_per_query": round(total_cost / num_queries, 8),
             "cost_per_1k": round((total_cost / num_queries) * 1000, 4),
@@ -332,40 +608,36 @@ def build_model_summary(
     }
 
 
-def build_unified_json(
-    questions: list[dict],
-    models: list[ModelConfig],
+def iter_question_entries(
+    questions: Questions,
+    models: Sequence[ModelConfig],
     all_responses: dict[str, list[ModelResponse]],
     all_grades: dict[str, list[GradingResult]],
-) -> dict:
-    """Build the unified JSON with all models and responses."""
-    
-    # Build model summaries
-    model_summaries = {}
-    for model in models:
-        key = get_model_key(model)
-        model_summaries[key] = build_model_summary(
-            model, all_responses[key], all_grades[key]
-        )
+) -> Iterator[dict]:
+    """Yield one output entry per question with every model's response and grade."""
+    keys = [model.key for model in models]
+    # Resolve each model's lists once rather than per question
+    columns = [(key, all_responses[key], all_grades[key]) for key in keys]
     
-    # Build questions with all model responses
-    questions_data = []
-    for i, q in enumerate(questions):
+    text = questions.text
+    context = questions.context
+    for i in range(len(text)):
+        entry_responses = {}
         question_entry = {
             "id": i + 1,
-            "question": q["question"],
-            "context": q.get("context", ""),
-            "responses": {}
+            "question": text[i],
+            "context": context[i],
+            "responses": entry_responses
         }
         
-        for model in models:
-            key = get_model_key(model)
-            r = all_responses[key][i]
-            g = all_grades[key][i]
+        for key, model_responses, model_grades in columns:
+            r = model_responses[i]
+            g = model_grades[i]
             
-            question_entry["responses"][key] = {
+            entry_responses[key] = {
                 "response": r.response,
                 "latency_ms": r.latency_ms,
+                "ttft_ms": r.ttft_ms,
                 "input_tokens": r.input_tokens,
                 "output_tokens": r.output_tokens,
                 "cost": r.cost,
@@ -380,7 +652,22 @@ def build_unified_json(
                 "error": r.error,
             }
         
-        questions_data.append(question_entry)
+        yield question_entry
+
+
+def build_unified_header(
+    questions: Questions,
+    models: Sequence[ModelConfig],
+    all_responses: dict[str, list[ModelResponse]],
+    all_grades: dict[str, list[GradingResult]],
+) -> dict:
+    """Build the metadata and per-model summaries of the unified JSON."""
+    keys = [model.key for model in models]
+    model_summaries = {}
+    for model, key in zip(models, keys):
+        model_summaries[key] = build_model_summary(
+            model, all_responses[key], all_grades[key]
+        )
     
     return {
         "metadata": {
@@ -389,20 +676,297 @@ def build_unified_json(
             "num_models": len(models),
             "grader_model": GRADER_MODEL,
             "grader_reasoning_effort": GRADER_REASONING_EFFORT,
-            "model_keys": [get_model_key(m) for m in models],
+            "model_keys": keys,
         },
         "models": model_summaries,
-        "questions": questions_data,
     }
 
 
+def build_unified_json(
+    questions: Questions,
+    models: Sequence[ModelConfig],
+    all_responses: dict[str, list[ModelResponse]],
+    all_grades: dict[str, list[GradingResult]],
+) -> dict:
+    """Build the unified JSON with all models and responses."""
+    unified = build_unified_header(questions, models, all_responses, all_grades)
+    unified["questions"] = list(iter_question_entries(questions, models, all_responses, all_grades))
+    return unified
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+def write_unified_json(
+    output_file: Path,
+    questions: Questions,
+    models: Sequence[ModelConfig],
+    all_responses: dict[str, list[ModelResponse]],
+    all_grades: dict[str, list[GradingResult]],
+    pretty: bool = False,
+    gzip_copy: bool = False,
+) -> dict:
+    """
+    Write the unified JSON, streaming the questions array one entry at a time.
+    
+    Output is compact, one question per line, so the full question list is
+    never held in memory twice. ``pretty`` instead builds the whole document
+    and indents it for reading by hand. ``gzip_copy`` also writes a gzipped
+    copy next to it (``.json.gz``) for serving with Content-Encoding: gzip.
+    Returns the header (metadata and model summaries).
+    """
+    if pretty:
+        unified = build_unified_json(questions, models, all_responses, all_grades)
+        with open(output_file, "wb") as f:
+            f.write(_dumps(unified, indent=True))
+        header = {"metadata": unified["metadata"], "models": unified["models"]}
+    else:
+        header = build_unified_header(questions, models, all_responses, all_grades)
+        with open(output_file, "wb") as f:
+            # Reopen the header object to append the questions array
+            f.write(_dumps(header)[:-1])
+            f.write(b',"questions":[')
+            separator = b"\n"
+            for entry in iter_question_entries(questions, models, all_responses, all_grades):
+                f.write(separator)
+                f.write(_dumps(entry))
+                separator = b",\n"
+            f.write(b"\n]}\n")
+    
+    if gzip_copy:
+        with open(output_file, "rb") as src, gzip.open(f"{output_file}.gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+    
+    return header
+
+
+def write_unified_ndjson(
+    output_file: Path,
+    header: dict,
+    questions: Questions,
+    models: Sequence[ModelConfig],
+    all_responses: dict[str, list[ModelResponse]],
+    all_grades: dict[str, list[GradingResult]],
+) -> None:
+    """
+    Write the unified results as NDJSON so readers can render rows as they arrive.
+    
+    One record per line, each tagged with a ``type``: a "metadata" line,
+    then one "model" line per model summary (with its ``key``), then one
+    "question" line per question entry. ``header`` is the metadata and model
+    summaries returned by write_unified_json.
+    """
+    with open(output_file, "wb") as f:
+        f.write(_dumps({"type": "metadata", **header["metadata"]}))
+        for key, summary in header["models"].items():
+            f.write(b"\n")
+            f.write(_dumps({"type": "model", "key": key, **summary}))
+        for entry in iter_question_entries(questions, models, all_responses, all_grades):
+            f.write(b"\n")
+            f.write(_dumps({"type": "question", **entry}))
+        f.write(b"\n")
+
+
+async def evaluate_models(
+    models: Sequence[ModelConfig],
+    questions: Questions,
+    client: AsyncOpenAI,
+    grader: AsyncGrader,
+    max_concurrent: int = 10,
+    limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    parallel_models: bool = False,
+    pipeline: bool = False,
+    batch: bool = False,
+    checkpoint: RunCheckpoint | None = None,
+    resume: bool = True,
+    grade_group: int = 1,
+    grader_batch: bool = False,
+) -> tuple[dict[str, list[ModelResponse]], dict[str, list[GradingResult]]]:
+    """
+    Run and grade every model, returning responses and grades keyed by model key.
+    
+    With a checkpoint, each model is saved as soon as it is graded and, when
+    ``resume`` is set, models with a saved shard are loaded instead of rerun.
+    With ``grader_batch``, grading waits until every model has its responses
+    and then grades them all in one grader Batch API job; it cannot be
+    combined with ``pipeline``.
+    """
+    all_responses: dict[str, list[ModelResponse]] = {}
+    all_grades: dict[str, list[GradingResult]] = {}
+    
+    resumed: dict[str, tuple[list[ModelResponse], list[GradingResult]]] = {}
+    if checkpoint is not None and resume:
+        for model in models:
+            key = model.key
+            saved = checkpoint.load(model)
+            if saved is not None:
+                resumed[key] = saved
+    pending = [model for model in models if model.key not in resumed]
+    limiters = model_limiters(pending, limiter, max_concurrent)
+    
+    # Models waiting for the grader batch; the last one to arrive submits it
+    offline_queue: list[tuple[ModelConfig, list[ModelResponse], asyncio.Future[list[GradingResult]]]] = []
+    
+    async def grade_offline(model: ModelConfig, responses: list[ModelResponse]) -> list[GradingResult]:
+        future = asyncio.get_running_loop().create_future()
+        offline_queue.append((model, responses, future))
+        if len(offline_queue) == len(pending):
+            try:
+                model_grades = await grade_responses_offline(
+                    questions, [(m.name, r) for m, r, _ in offline_queue], grader
+                )
+                for (_, _, queued), grades in zip(offline_queue, model_grades):
+                    queued.set_result(grades)
+            except Exception as e:
+                for _, _, queued in offline_queue:
+                    if not queued.done():
+                        queued.set_exception(e)
+        return await future
+    
+    async def grade_and_save(model: ModelConfig, responses: list[ModelResponse]) -> list[GradingResult]:
+        if grader_batch:
+            grades = await grade_offline(model, responses)
+        else:
+            grades = await grade_responses(questions, responses, grader, model.name, grade_group)
+        if checkpoint is not None:
+            checkpoint.save(model, responses, grades)
+        return grades
+    
+    multi_model_responses: dict[str, list[ModelResponse]] = {}
+    multi_model_grades: dict[str, list[GradingResult]] = {}
+    grading_tasks: dict[str, asyncio.Task[list[GradingResult]]] = {}
+    if batch and pending:
+        print(f"\n📦 Running {len(pending)} models on {len(questions)} questions through the Batch API...")
+        unique_responses = await run_batch_evaluation(client, pending, questions.unique_pairs)
+        multi_model_responses = {name: questions.scatter(r) for name, r in unique_responses.items()}
+        
+        model_grades = await asyncio.gather(*(
+            grade_and_save(model, multi_model_responses[model.name]) for model in pending
+        ))
+        multi_model_grades = dict(zip((model.name for model in pending), model_grades))
+    elif parallel_models and pending:
+        print(f"\n🔄 Running {len(pending)} models concurrently on {len(questions)} questions...")
+        # One semaphore across all models keeps total in-flight calls at max_concurrent
+        shared_semaphore = asyncio.Semaphore(max_concurrent)
+        runners = [
+            AsyncModelRunner(model, client, limiter=limiters[model.name], cache=cache, semaphore=shared_semaphore)
+            for model in pending
+        ]
+        # Each model is graded as soon as it finishes, overlapping the models
+        # still generating; the grader's own semaphore bounds the calls
+        models_by_name = {model.name: model for model in pending}
+        model_grading_tasks: dict[str, asyncio.Task[list[GradingResult]]] = {}
+        
+        def start_grading(model_name: str, unique_responses: list[ModelResponse]) -> None:
+            responses = questions.scatter(unique_responses)
+            multi_model_responses[model_name] = responses
+            print(f"   ✓ {model_name} finished ({len(multi_model_responses)}/{len(pending)} models)")
+            model_grading_tasks[model_name] = asyncio.ensure_future(
+                grade_and_save(models_by_name[model_name], responses)
+            )
+        
+        await run_multi_model(runners, questions.unique_pairs, on_model_done=start_grading)
+        model_grades = await asyncio.gather(*(model_grading_tasks[model.name] for model in pending))
+        multi_model_grades = dict(zip((model.name for model in pending), model_grades))
+    
+    for i, model in enumerate(models):
+        print(f"\n[{i+1}/{len(models)}] {model.name}")
+        print("-" * 40)
+        
+        key = model.key
+        
+        if key in resumed:
+            print("   ♻ Loaded from checkpoint")
+            responses, grades = resumed[key]
+            print_run_summary(responses)
+            all_responses[key] = responses
+            all_grades[key] = grades
+            continue
+        
+        if pipeline:
+            # Run and grade together
+            print(f"\n🔄 Running and grading {model.name} on {len(questions)} questions...")
+            runner = AsyncModelRunner(model, client, max_concurrent, limiter=limiters[model.name], cache=cache)
+            results = questions.scatter(await run_and_grade(runner, grader, questions.unique_pairs))
+            responses = [r for r, _ in results]
+            grades = [g for _, g in results]
+            print_run_summary(responses)
+            grading_errors = sum(1 for g in grades if g.error)
+            if grading_errors:
+                print(f"   ⚠ {grading_errors} grading errors")
+            if checkpoint is not None:
+                checkpoint.save(model, responses, grades)
+            all_responses[key] = responses
+            all_grades[key] = grades
+            continue
+        
+        if parallel_models or batch:
+            # Already run and graded above
+            print_run_summary(multi_model_responses[model.name])
+            all_responses[key] = multi_model_responses[model.name]
+            all_grades[key] = multi_model_grades[model.name]
+            continue
+        
+        # Run model
+        responses = await run_model_evaluation(
+            model, questions, max_concurrent, limiters[model.name], cache, client
+        )
+        all_responses[key] = responses
+        
+        # Grade in the background so grading overlaps the next model's generation
+        grading_tasks[key] = asyncio.ensure_future(grade_and_save(model, responses))
+    
+    for key, task in grading_tasks.items():
+        all_grades[key] = await task
+    
+    return all_responses, all_grades
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Run unified LLM evaluation")
     parser.add_argument("--data", type=str, help="Path to Langfuse CSV export")
     parser.add_argument("--samples", type=int, default=100, help="Number of samples to evaluate")
     parser.add_argument("--models", type=str, help="Comma-separated model names (default: all)")
     parser.add_argument("--concurrent", type=int, default=10, help="Max concurrent requests")
+    parser.add_argument("--rpm", type=int, help="Shared requests-per-minute limit for model calls")
+    parser.add_argument("--tpm", type=int, help="Shared tokens-per-minute limit for model calls")
+    parser.add_argument("--model-limits", type=str, help="Per-model RPM:TPM limits by model id, e.g. gpt-5-mini=500:200000 (overrides --rpm/--tpm)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--parallel-models", action="store_true", help="Run all models concurrently instead of one at a time")
+    mode.add_argument("--pipeline", action="store_true", help="Grade each response as soon as it arrives")
+    mode.add_argument("--batch", action="store_true", help="Run models through the Batch API (half price, up to 24h)")
+    parser.add_argument("--stream", action="store_true", help="Stream Responses API calls and record time to first token")
+    parser.add_argument("--response-cache", type=str, help="SQLite file caching model responses across runs")
+    parser.add_argument("--grade-cache", type=str, help="SQLite file caching grades across runs")
+    parser.add_argument(
+        "--cache-mode", choices=["enabled", "replay", "disabled"], default="enabled",
+        help="Response cache use: enabled, replay (cached responses only, no model calls) or disabled",
+    )
+    parser.add_argument(
+        "--grader-cache-mode", choices=["enabled", "replay", "disabled"], default="enabled",
+        help="Grade cache use: enabled, replay (cached grades only, no grader calls) or disabled",
+    )
+    parser.add_argument(
+        "--grader-mode", choices=["sync", "batch"], default="sync",
+        help="Grade live (sync) or, once every model has finished, in one half-price Batch API job (batch)",
+    )
+    parser.add_argument("--grade-group", type=int, default=1, help="Responses graded per grader call (default: 1; ignored with --pipeline and --grader-mode batch)")
+    parser.add_argument("--checkpoint-dir", type=str, help="Save each model's results here as it finishes and resume from them")
+    parser.add_argument("--force", action="store_true", help="Rerun models that already have a checkpoint")
+    parser.add_argument(
+        "--dedup-threshold", type=float,
+        help="Answer questions whose embeddings have cosine similarity >= this once (e.g. 0.95; default: off)",
+    )
+    parser.add_argument("--aiohttp", action="store_true", help="Use the aiohttp HTTP transport (needs openai[aiohttp])")
     parser.add_argument("--output", type=str, default="../public/data", help="Output directory")
+    parser.add_argument("--pretty", action="store_true", help="Indent the output JSON for reading (larger file)")
+    parser.add_argument("--ndjson", action="store_true", help="Also write the results as NDJSON (evaluation_results.ndjson)")
+    parser.add_argument("--gzip", action="store_true", help="Also write a gzipped copy of the output JSON (.json.gz)")
     parser.add_argument("--list-models", action="store_true", help="List available models")
     
     args = parser.parse_args()
@@ -416,24 +980,50 @@ async def main():
         print("Usage: python run_evaluation.py --data path/to/langfuse.csv --samples 100")
         sys.exit(1)
     
+    if args.samples < 0:
+        print("Error: --samples must be 0 (all rows) or more")
+        sys.exit(1)
+    if args.batch and args.response_cache:
+        # Batch jobs are submitted whole and never read or fill the response cache
+        print("Error: --response-cache cannot be combined with --batch")
+        sys.exit(1)
+    if args.cache_mode == "replay" and not args.response_cache:
+        print("Error: --cache-mode replay needs --response-cache")
+        sys.exit(1)
+    if args.grader_cache_mode == "replay" and not args.grade_cache:
+        print("Error: --grader-cache-mode replay needs --grade-cache")
+        sys.exit(1)
+    if args.grader_mode == "batch" and args.pipeline:
+        print("Error: --grader-mode batch cannot be combined with --pipeline")
+        sys.exit(1)
+    if args.dedup_threshold is not None and not 0 < args.dedup_threshold <= 1:
+        print("Error: --dedup-threshold must be in (0, 1]")
+        sys.exit(1)
+    
     # Check if data file exists
     if not os.path.exists(args.data):
         print(f"Error: Data file not found: {args.data}")
         sys.exit(1)
     
     # Load questions
-    questions = load_langfuse_data(args.data, args.samples)
-    if not questions:
+    rows = load_langfuse_data(args.data, args.samples)
+    if not rows:
         print("Error: No valid questions found in CSV")
         sys.exit(1)
+    questions = Questions.from_rows(rows)
+    if len(questions.unique_pairs) < len(questions):
+        print(f"  - {len(questions) - len(questions.unique_pairs)} duplicate questions reuse one API call each")
     
     # Determine which models to run
     if args.models:
-        model_names = [m.strip() for m in args.models.split(",")]
+        model_names = split_model_names(args.models)
         models_to_run = []
         for name in model_names:
-            if name in MODELS_BY_NAME:
-                models_to_run.append(MODELS_BY_NAME[name])
+            model = find_model(name)
+            if model is not None:
+                # Each model's responses are reused everywhere, so never run it twice
+                if model not in models_to_run:
+                    models_to_run.append(model)
             else:
                 print(f"Warning: Unknown model '{name}', skipping")
                 print(f"  Available models: {list(MODELS_BY_NAME.keys())[:5]}...")
@@ -444,6 +1034,31 @@ async def main():
     else:
         models_to_run = ALL_MODELS
     
+    if args.model_limits:
+        try:
+            model_limits = parse_model_limits(args.model_limits)
+        except ValueError as e:
+            print(f"Error: --model-limits: {e}")
+            sys.exit(1)
+        for model_id in model_limits.keys() - {m.model_id for m in models_to_run}:
+            print(f"Warning: --model-limits names '{model_id}', which no selected model uses")
+        models_to_run = [
+            replace(m, rpm_limit=model_limits[m.model_id][0], tpm_limit=model_limits[m.model_id][1])
+            if m.model_id in model_limits else m
+            for m in models_to_run
+        ]
+    
+    if args.stream:
+        models_to_run = [
+            replace(m, stream=True) if m.api_type == RESPONSES_API else m
+            for m in models_to_run
+        ]
+    
+    # Created before any API calls so a bad --output path fails up front
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / "evaluation_results.json"
+    
     print(f"\n{'='*60}")
     print("Unified LLM Evaluation")
     print(f"{'='*60}")
@@ -453,41 +1068,80 @@ async def main():
     print(f"{'='*60}")
     
     # Initialize grader
-    grader = Grader()
+    # Model calls and grader calls are each capped at --concurrent, so the
+    # pool must hold both at once or requests queue for a free connection
+    client = get_async_client(use_aiohttp=args.aiohttp, max_connections=max(64, 2 * args.concurrent))
+    grade_cache = None
+    if args.grade_cache and args.grader_cache_mode != "disabled":
+        grade_cache = GradeCache(args.grade_cache, replay=args.grader_cache_mode == "replay")
+    grader = AsyncGrader(client=client, max_concurrent=args.concurrent, disk_cache=grade_cache)
     
-    # Run all models
-    all_responses: dict[str, list[ModelResponse]] = {}
-    all_grades: dict[str, list[GradingResult]] = {}
+    if args.dedup_threshold is not None:
+        canonical = await paraphrase_canonicals(client, questions.unique_pairs, args.dedup_threshold)
+        merged = questions.merged(canonical)
+        print(f"🔗 {len(questions.unique_pairs) - len(merged.unique_pairs)} paraphrased questions reuse another question's answer")
+        questions = merged
     
-    for i, model in enumerate(models_to_run):
-        print(f"\n[{i+1}/{len(models_to_run)}] {model.name}")
-        print("-" * 40)
-        
-        key = get_model_key(model)
-        
-        # Run model
-        responses = await run_model_evaluation(model, questions, args.concurrent)
-        all_responses[key] = responses
-        
-        # Grade responses
-        grades = grade_responses(questions, responses, grader, model.name)
-        all_grades[key] = grades
+    # Shared by every model without its own rpm_limit/tpm_limit, so they draw from one budget
+    limiter = None
+    if args.rpm or args.tpm:
+        limiter = RateLimiter(
+            rpm=args.rpm or 0,
+            tpm=args.tpm or 0,
+            max_concurrent=args.concurrent,
+        )
+    
+    response_cache = None
+    if args.response_cache and args.cache_mode != "disabled":
+        response_cache = ResponseCache(args.response_cache, replay=args.cache_mode == "replay")
+    checkpoint = RunCheckpoint(args.checkpoint_dir, questions.digest()) if args.checkpoint_dir else None
+    
+    # Run all models
+    try:
+        all_responses, all_grades = await evaluate_models(
+            models_to_run,
+            questions,
+            client,
+            grader,
+            max_concurrent=args.concurrent,
+            limiter=limiter,
+            cache=response_cache,
+            parallel_models=args.parallel_models,
+            pipeline=args.pipeline,
+            batch=args.batch,
+            checkpoint=checkpoint,
+            resume=not args.force,
+            grade_group=args.grade_group,
+            grader_batch=args.grader_mode == "batch",
+        )
+    finally:
+        if response_cache is not None:
+            print(f"\n💾 Response cache: {response_cache.hits} hits, {response_cache.misses} misses")
+            response_cache.close()
+        if grade_cache is not None:
+            print(f"💾 Grade cache: {grade_cache.hits} hits, {grade_cache.misses} misses")
+            grade_cache.close()
+        await close_async_client()
     
     # Build unified JSON
     print(f"\n{'='*60}")
     print("Building unified JSON...")
     
-    unified_data = build_unified_json(questions, models_to_run, all_responses, all_grades)
-    
-    # Save output
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    output_file = output_dir / "evaluation_results.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(unified_data, f, indent=2)
+    # Save output off the event loop; serialization and disk writes are blocking
+    unified_data = await asyncio.to_thread(
+        write_unified_json, output_file, questions, models_to_run, all_responses, all_grades,
+        pretty=args.pretty, gzip_copy=args.gzip,
+    )
     
     print(f"\n✅ Saved: {output_file}")
+    if args.gzip:
+        print(f"✅ Saved: {output_file}.gz")
+    if args.ndjson:
+        ndjson_file = output_file.with_suffix(".ndjson")
+        await asyncio.to_thread(
+            write_unified_ndjson, ndjson_file, unified_data, questions, models_to_run, all_responses, all_grades
+        )
+        print(f"✅ Saved: {ndjson_file}")
     print(f"\n{'='*60}")
     print("Summary")
     print(f"{'='*60}")
@@ -496,13 +1150,15 @@ async def main():
     print(f"\n{'Model':<35} {'Score':>8} {'Latency':>10} {'Cost':>10}")
     print("-" * 65)
     for model in models_to_run:
-        key = get_model_key(model)
+        key = model.key
         summary = unified_data["models"][key]
-        print(f"{model.name:<35} {summary['avg_score']:>8.2f} {summary['avg_latency_ms']:>8.0f}ms ${summary['costs']['total_cost']:>8.4f}")
+        latency = summary["avg_latency_ms"]
+        latency_text = f"{latency:>8.0f}ms" if latency is not None else f"{'n/a':>10}"
+        print(f"{model.name:<35} {summary['avg_score']:>8.2f} {latency_text} ${summary['costs']['total_cost']:>8.4f}")
     
     # Print totals
-    total_cost = sum(unified_data["models"][get_model_key(m)]["costs"]["total_cost"] for m in models_to_run)
-    avg_score = sum(unified_data["models"][get_model_key(m)]["avg_score"] for m in models_to_run) / len(models_to_run)
+    total_cost = sum(unified_data["models"][m.key]["costs"]["total_cost"] for m in models_to_run)
+    avg_score = sum(unified_data["models"][m.key]["avg_score"] for m in models_to_run) / len(models_to_run)
     print("-" * 65)
     print(f"{'AVERAGE':<35} {avg_score:>8.2f} {'':>10} ${total_cost:>8.4f}")
     
@@ -510,4 +1166,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+: tasks that finish without suspending (cache hits,
+            # empty-response grades) complete inline instead of via the loop
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        runner.run(main())
\ No newline at end of file